@@ -15,7 +15,7 @@ English and Bangla news dataset. It supports:
 import sqlite3
 import re
 from pathlib import Path
-from typing import List, Dict, Tuple, Optional
+from typing import List, Dict, Iterable, Tuple, Optional
 from dataclasses import dataclass
 import numpy as np
 
@@ -33,6 +33,13 @@ try:
 except ImportError:
     HAS_INVERTED_INDEX = False
 
+# Try to import joblib for threaded batch language detection
+try:
+    from joblib import Parallel, delayed
+    HAS_JOBLIB = True
+except ImportError:
+    HAS_JOBLIB = False
+
 # Try to import translation libraries
 try:
     from googletrans import Translator
@@ -50,6 +57,9 @@ except ImportError:
 @dataclass
 class Article:
     """Article data structure."""
+    # One instance per loaded article, so skip the per-instance __dict__
+    __slots__ = ('id', 'source', 'title', 'body', 'url', 'date', 'language')
+
     id: int
     source: str
     title: str
@@ -67,6 +77,21 @@ class BM25CLIR:
     2. Persistent (inverted_index): SQLite-based, instant startup after initial build
     """
 
+    # Shorter texts are classified with C-level bytes.count/translate scans,
+    # which beat NumPy's call overhead below roughly a thousand characters
+    VECTORIZE_MIN_LENGTH = 1024
+    # Long texts are scanned in chunks of this many characters so a clear
+    # majority can stop the scan early
+    DETECT_CHUNK_LENGTH = 8192
+    # Code points classified per detect_language_batch chunk (~128 KB as UTF-32)
+    BATCH_CHUNK_CODEPOINTS = 32768
+    _ASCII_NON_LETTERS = bytes(b for b in range(128) if not chr(b).isalpha())
+    # Tokenizer patterns, compiled once since every document is tokenized
+    _ENGLISH_TOKEN_PATTERN = re.compile(r'\b[a-z0-9]+\b')
+    # Same tokens for ASCII text, with cheaper ASCII word-boundary checks
+    _ENGLISH_TOKEN_PATTERN_ASCII = re.compile(r'\b[a-z0-9]+\b', re.ASCII)
+    _BANGLA_PUNCTUATION_PATTERN = re.compile(r'[।॥,.;:!?\'\"()\[\]{}<>@#$%^&*+=|\\\/\-_—–''""…\n\r\t]')
+
     def __init__(self, db_path: str = None, enable_translation: bool = True,
                  use_inverted_index: bool = True):
         """Initialize the BM25 CLIR system.
@@ -97,6 +122,7 @@ class BM25CLIR:
         # Storage for articles and BM25 models
         self.articles: Dict[str, List[Article]] = {"en": [], "bn": []}
         self.articles_by_id: Dict[int, Article] = {}  # Fast lookup by ID
+        self._source_counts: Dict[str, int] = {}  # Filled while loading, for get_statistics
         self.tokenized_docs: Dict[str, List[List[str]]] = {"en": [], "bn": []}
         self.bm25_models: Dict[str, Optional[BM25Okapi]] = {"en": None, "bn": None}
 
@@ -148,6 +174,7 @@ class BM25CLIR:
             article = Article(*row)
             self.articles["en"].append(article)
             self.articles_by_id[article.id] = article
+            self._source_counts[article.source] = self._source_counts.get(article.source, 0) + 1
 
         # Load Bangla articles
         cursor.execute("""
@@ -159,6 +186,7 @@ class BM25CLIR:
             article = Article(*row)
             self.articles["bn"].append(article)
             self.articles_by_id[article.id] = article
+            self._source_counts[article.source] = self._source_counts.get(article.source, 0) + 1
 
         conn.close()
 
@@ -176,10 +204,26 @@ class BM25CLIR:
         Returns:
             "bn" for Bangla, "en" for English
         """
-        # Count Bangla Unicode characters
-        bangla_chars = sum(1 for char in text if '\u0980' <= char <= '\u09FF')
-        # Count English alphabetic characters
-        english_chars = sum(1 for char in text if char.isalpha() and ord(char) < 128)
+        # Pure-ASCII text cannot contain Bangla characters
+        if text.isascii():
+            return "en"
+        
+        if len(text) < self.VECTORIZE_MIN_LENGTH:
+            bangla_chars, english_chars = self._count_scripts(text)
+        else:
+            # Classify code points a chunk at a time instead of looping in Python
+            all_codepoints = np.frombuffer(text.encode('utf-32-le', 'surrogatepass'), dtype=np.uint32)
+            bangla_chars = english_chars = 0
+            remaining = len(all_codepoints)
+            for start in range(0, len(all_codepoints), self.DETECT_CHUNK_LENGTH):
+                codepoints = all_codepoints[start:start + self.DETECT_CHUNK_LENGTH]
+                chunk_bangla, chunk_english = self._count_codepoints(codepoints)
+                bangla_chars += chunk_bangla
+                english_chars += chunk_english
+                remaining -= len(codepoints)
+                # Stop once the unread characters can no longer change the winner
+                if abs(bangla_chars - english_chars) > remaining:
+                    break
         
         # Determine language based on character count
         if bangla_chars > english_chars:
@@ -187,6 +231,104 @@ class BM25CLIR:
         else:
             return "en"
     
+    def detect_language_stream(self, chunks: Iterable[str]) -> str:
+        """Detect if a text supplied in pieces is Bangla or English.
+        
+        Gives the same answer as detect_language on the concatenated chunks,
+        but only ever holds one chunk in memory, so whole articles can be
+        classified while they are read.
+        
+        Args:
+            chunks: Consecutive pieces of the text
+            
+        Returns:
+            "bn" for Bangla, "en" for English
+        """
+        bangla_chars = english_chars = 0
+        for chunk in chunks:
+            chunk_bangla, chunk_english = self._count_scripts(chunk)
+            bangla_chars += chunk_bangla
+            english_chars += chunk_english
+        return "bn" if bangla_chars > english_chars else "en"
+    
+    def _count_scripts(self, text: str) -> Tuple[int, int]:
+        """Count Bangla characters and ASCII letters in text."""
+        if len(text) >= self.VECTORIZE_MIN_LENGTH:
+            return self._count_codepoints(
+                np.frombuffer(text.encode('utf-32-le', 'surrogatepass'), dtype=np.uint32)
+            )
+        
+        # Every Bangla code point (U+0980-U+09FF) encodes to UTF-8 as
+        # E0 A6 xx or E0 A7 xx, and E0 only ever appears as a lead byte
+        encoded = text.encode('utf-8', 'surrogatepass')
+        bangla_chars = encoded.count(b'\xe0\xa6') + encoded.count(b'\xe0\xa7')
+        # Count English alphabetic characters by deleting everything else
+        ascii_bytes = text.encode('ascii', 'ignore')
+        english_chars = len(ascii_bytes.translate(None, self._ASCII_NON_LETTERS))
+        return bangla_chars, english_chars
+    
+    @staticmethod
+    def _count_codepoints(codepoints: np.ndarray) -> Tuple[int, int]:
+        """Count Bangla characters and ASCII letters in a UTF-32 code point array."""
+        # Unsigned subtraction wraps out-of-range code points past the bound;
+        # "| 0x20" additionally folds A-Z onto a-z
+        bangla_chars = int(np.count_nonzero((codepoints - 0x0980) < 0x80))
+        english_chars = int(np.count_nonzero(((codepoints | 0x20) - 0x61) < 26))
+        return bangla_chars, english_chars
+    
+    def detect_language_batch(self, texts: List[str]) -> List[str]:
+        """Detect the language of many texts with vectorized NumPy passes.
+        
+        Gives the same answers as calling detect_language on each text, but
+        classifies the code points of many texts together so NumPy's call
+        overhead is paid once per chunk instead of once per text. Chunks are
+        sized to stay cache-resident and, with joblib, run on parallel
+        threads: NumPy releases the GIL inside the mask reductions.
+        
+        Args:
+            texts: Texts to analyze
+            
+        Returns:
+            "bn" or "en" for each text, in input order
+        """
+        chunks = []
+        start = size = 0
+        for i, text in enumerate(texts):
+            size += len(text) + 1
+            if size >= self.BATCH_CHUNK_CODEPOINTS:
+                chunks.append(texts[start:i + 1])
+                start, size = i + 1, 0
+        if start < len(texts):
+            chunks.append(texts[start:])
+        
+        if HAS_JOBLIB and len(chunks) > 1:
+            parts = Parallel(n_jobs=-1, prefer='threads')(
+                delayed(self._detect_language_chunk)(chunk) for chunk in chunks
+            )
+        else:
+            parts = [self._detect_language_chunk(chunk) for chunk in chunks]
+        return [lang for part in parts for lang in part]
+    
+    def _detect_language_chunk(self, texts: List[str]) -> List[str]:
+        """Vectorized detect_language over one non-empty chunk of texts."""
+        # A NUL after every text keeps each segment non-empty (as reduceat
+        # requires) without being counted as either script
+        codepoints = np.frombuffer(
+            ('\x00'.join(texts) + '\x00').encode('utf-32-le', 'surrogatepass'),
+            dtype=np.uint32,
+        )
+        starts = np.zeros(len(texts), dtype=np.int64)
+        np.cumsum([len(text) + 1 for text in texts[:-1]], out=starts[1:])
+        
+        # Same code point tests as the vectorized path of detect_language
+        bangla_mask = (codepoints - 0x0980) < 0x80
+        english_mask = ((codepoints | 0x20) - 0x61) < 26
+        bangla_counts = np.add.reduceat(bangla_mask, starts, dtype=np.int32)
+        english_counts = np.add.reduceat(english_mask, starts, dtype=np.int32)
+        
+        is_bangla = bangla_counts > english_counts
+        return ["bn" if bangla else "en" for bangla in is_bangla.tolist()]
+    
     def translate_query(self, query: str, target_lang: str) -> Optional[str]:
         """Translate query to target language.
         
@@ -225,7 +367,9 @@ class BM25CLIR:
             List of tokens (lowercase, alphanumeric)
         """
         # Convert to lowercase and split on non-alphanumeric
-        tokens = re.findall(r'\b[a-z0-9]+\b', text.lower())
+        text = text.lower()
+        pattern = self._ENGLISH_TOKEN_PATTERN_ASCII if text.isascii() else self._ENGLISH_TOKEN_PATTERN
+        tokens = pattern.findall(text)
         # Filter out very short tokens
         return [t for t in tokens if len(t) > 1]
     
@@ -238,18 +382,17 @@ class BM25CLIR:
         Returns:
             List of tokens (split on whitespace and cleaned)
         """
-        import re
-        
         # Remove only specific punctuation, keep all Bangla Unicode characters
         # Remove: periods, commas, quotes, brackets, etc. but keep Bangla text intact
-        punctuation = r'[।॥,.;:!?\'\"()\[\]{}<>@#$%^&*+=|\\\/\-_—–''""…\n\r\t]'
-        text = re.sub(punctuation, ' ', text)
+        text = self._BANGLA_PUNCTUATION_PATTERN.sub(' ', text)
         
         # Split on whitespace
-        tokens = text.strip().split()
+        # (split() already trims the text, and its tokens hold no whitespace,
+        # so no strip() copies of either are needed)
+        tokens = text.split()
         
-        # Filter out very short tokens, empty tokens, and pure numbers
-        tokens = [t.strip() for t in tokens if len(t) > 1 and not t.isdigit()]
+        # Filter out very short tokens and pure numbers
+        tokens = [t for t in tokens if len(t) > 1 and not t.isdigit()]
         
         return tokens
     
@@ -412,6 +555,8 @@ class BM25CLIR:
 
         results = []
         seen_urls = set()  # Track URLs to avoid duplicates
+        query_tokens_set = set(query_tokens)
+        doc_tokens = self.tokenized_docs[language]
 
         for idx in top_indices:
             if scores[idx] > 0:  # Only return positive scores
@@ -422,13 +567,17 @@ class BM25CLIR:
                     continue
                 seen_urls.add(article.url)
 
-                # Verify article actually contains at least one query term
-                article_text = f"{article.title} {article.body}".lower()
-                article_tokens = set(tokenizer(article_text))
-                query_tokens_set = set(query_tokens)
+                # Verify article actually contains at least one query term,
+                # reusing the tokens from build_index instead of re-tokenizing
+                # the article. English tokens are already lowercase; Bangla
+                # ones are lowercased per token, which matches tokenizing the
+                # lowercased text.
+                article_tokens = doc_tokens[idx]
+                if language == "bn":
+                    article_tokens = [t.lower() for t in article_tokens]
 
                 # Check if any query token appears in article
-                if query_tokens_set & article_tokens:  # Set intersection
+                if not query_tokens_set.isdisjoint(article_tokens):
                     results.append((article, float(scores[idx])))
 
                     # Stop when we have enough results
@@ -609,12 +758,8 @@ class BM25CLIR:
         else:
             stats["indexed_languages"] = [lang for lang, model in self.bm25_models.items() if model is not None]
 
-        # Source distribution
-        sources = {}
-        for lang in ["en", "bn"]:
-            for article in self.articles[lang]:
-                sources[article.source] = sources.get(article.source, 0) + 1
-        stats["sources"] = sources
+        # Source distribution, counted once in _load_articles
+        stats["sources"] = dict(self._source_counts)
 
         return stats
     
@@ -695,7 +840,7 @@ def main():
     import io
 
     # Handle Unicode output on Windows
-    if sys.platform == 'win32':
+    if sys.platform == 'win32' and (sys.stdout.encoding or '').lower() not in ('utf-8', 'utf8'):
         sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8', errors='replace')
 
     print("="*80)
@@ -5,11 +5,22 @@ import sys
 import io
 
 # Handle Unicode output on Windows
-if sys.platform == 'win32':
+if sys.platform == 'win32' and (sys.stdout.encoding or '').lower() not in ('utf-8', 'utf8'):
     sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8', errors='replace')
 
 from bm25_clir import BM25CLIR
 
+# Shared across examples so the article table is loaded from the database once
+_clir = None
+
+
+def get_clir() -> BM25CLIR:
+    """Return the shared BM25CLIR instance, creating it on first use."""
+    global _clir
+    if _clir is None:
+        _clir = BM25CLIR()
+    return _clir
+
 
 def example_1_basic_english_search():
     """Example 1: Basic English search."""
@@ -18,7 +29,7 @@ def example_1_basic_english_search():
     print("="*80)
     
     # Initialize and build index
-    clir = BM25CLIR()
+    clir = get_clir()
     clir.build_index("en")  # Only English index
     
     # Search
@@ -35,7 +46,7 @@ def example_2_basic_bangla_search():
     print("="*80)
     
     # Initialize and build index
-    clir = BM25CLIR()
+    clir = get_clir()
     clir.build_index("bn")  # Only Bangla index
     
     # Search
@@ -52,7 +63,7 @@ def example_3_compare_languages():
     print("="*80)
     
     # Initialize and build both indexes
-    clir = BM25CLIR()
+    clir = get_clir()
     clir.build_index("both")
     
     # Same query in both languages
@@ -74,7 +85,7 @@ def example_4_multilingual_search():
     print("="*80)
     
     # Initialize
-    clir = BM25CLIR()
+    clir = get_clir()
     clir.build_index("both")
     
     # Search across both languages
@@ -101,7 +112,7 @@ def example_5_custom_scoring():
     print("="*80)
     
     # Initialize
-    clir = BM25CLIR()
+    clir = get_clir()
     clir.build_index("en")
     
     # Search
@@ -130,7 +141,7 @@ def example_6_batch_queries():
     print("="*80)
     
     # Initialize once
-    clir = BM25CLIR()
+    clir = get_clir()
     clir.build_index("both")
     
     # Multiple queries
@@ -158,7 +169,7 @@ def example_7_get_article_details():
     print("="*80)
     
     # Initialize
-    clir = BM25CLIR()
+    clir = get_clir()
     clir.build_index("en")
     
     # First search to get an article ID
@@ -185,7 +196,7 @@ def example_8_statistics():
     print("="*80)
     
     # Initialize
-    clir = BM25CLIR()
+    clir = get_clir()
     stats = clir.get_statistics()
     
     print("\nDataset Overview:")
@@ -205,7 +216,7 @@ def interactive_search():
     print("="*80)
     
     # Initialize
-    clir = BM25CLIR()
+    clir = get_clir()
     clir.build_index("both")
     
     print("\nSystem ready! Enter your queries.")
@@ -50,6 +50,12 @@ class InvertedIndex:
     K1 = 1.5
     B = 0.75
 
+    # Tokenizer patterns, compiled once since every document is tokenized
+    _ENGLISH_TOKEN_PATTERN = re.compile(r'\b[a-z0-9]+\b')
+    # Same tokens for ASCII text, with cheaper ASCII word-boundary checks
+    _ENGLISH_TOKEN_PATTERN_ASCII = re.compile(r'\b[a-z0-9]+\b', re.ASCII)
+    _BANGLA_PUNCTUATION_PATTERN = re.compile(r'[।॥,.;:!?\'\"()\[\]{}<>@#$%^&*+=|\\\/\-_—–''""…\n\r\t]')
+
     def __init__(self, index_path: str = None, source_db_path: str = None):
         """Initialize the inverted index.
 
@@ -84,7 +90,7 @@ class InvertedIndex:
             tables = {row[0] for row in cursor.fetchall()}
             conn.close()
             return {'terms', 'postings', 'doc_lengths', 'metadata'}.issubset(tables)
-        except:
+        except sqlite3.Error:
             return False
 
     def _create_schema(self, conn: sqlite3.Connection):
@@ -151,15 +157,17 @@ class InvertedIndex:
 
     def _tokenize_english(self, text: str) -> List[str]:
         """Tokenize English text (same as bm25_clir.py)."""
-        tokens = re.findall(r'\b[a-z0-9]+\b', text.lower())
+        text = text.lower()
+        pattern = self._ENGLISH_TOKEN_PATTERN_ASCII if text.isascii() else self._ENGLISH_TOKEN_PATTERN
+        tokens = pattern.findall(text)
         return [t for t in tokens if len(t) > 1]
 
     def _tokenize_bangla(self, text: str) -> List[str]:
         """Tokenize Bangla text (same as bm25_clir.py)."""
-        punctuation = r'[।॥,.;:!?\'\"()\[\]{}<>@#$%^&*+=|\\\/\-_—–''""…\n\r\t]'
-        text = re.sub(punctuation, ' ', text)
-        tokens = text.strip().split()
-        return [t.strip() for t in tokens if len(t) > 1 and not t.isdigit()]
+        text = self._BANGLA_PUNCTUATION_PATTERN.sub(' ', text)
+        # split() already trims and drops whitespace, so no strip() copies
+        tokens = text.split()
+        return [t for t in tokens if len(t) > 1 and not t.isdigit()]
 
     def _tokenize(self, text: str, language: str) -> List[str]:
         """Tokenize text based on language."""
@@ -473,7 +481,7 @@ def main():
     import io
 
     # Handle Unicode output on Windows
-    if sys.platform == 'win32':
+    if sys.platform == 'win32' and (sys.stdout.encoding or '').lower() not in ('utf-8', 'utf8'):
         sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8', errors='replace')
 
     print("=" * 60)
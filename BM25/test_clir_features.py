@@ -13,7 +13,7 @@ import sys
 import io
 
 # Handle Unicode output on Windows
-if sys.platform == 'win32':
+if sys.platform == 'win32' and (sys.stdout.encoding or '').lower() not in ('utf-8', 'utf8'):
     sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8', errors='replace')
 
 from bm25_clir import BM25CLIR
@@ -21,7 +21,7 @@ Example Usage:
 __version__ = "1.0.0"
 __author__ = "CLIR System"
 
-from .fuzzy_matcher import FuzzyMatcher
+from .fuzzy_matcher import FuzzyMatcher, TransliterationResult
 from .clir_search import CLIRSearch
 
-__all__ = ['FuzzyMatcher', 'CLIRSearch']
+__all__ = ['FuzzyMatcher', 'TransliterationResult', 'CLIRSearch']
@@ -7,15 +7,22 @@ Combines BM25 lexical matching with fuzzy matching techniques
 cross-lingual information retrieval.
 """
 
-import json
+import heapq
 import sqlite3
-import sys
 import time
-from typing import List, Dict, Optional, Tuple
+from functools import lru_cache
+from typing import List, Dict, FrozenSet, Optional, Tuple
 from pathlib import Path
 from collections import defaultdict
 
-from fuzzy_matcher import FuzzyMatcher
+from fuzzy_matcher import FuzzyMatcher, TransliterationResult, NUMPY_AVAILABLE
+
+# MinHash LSH for sublinear candidate lookup in Jaccard search
+try:
+    from datasketch import MinHash, MinHashLSH
+    DATASKETCH_AVAILABLE = True
+except ImportError:
+    DATASKETCH_AVAILABLE = False
 
 # Try to import BM25 from existing module
 try:
@@ -38,11 +45,23 @@ class CLIRSearch:
     - Hybrid: Combines all methods with weighted scoring
     """
 
+    # MinHash LSH settings for approximate Jaccard candidate lookup
+    LSH_NUM_PERM = 128
+    LSH_NGRAM = 3
+
+    # Distinct (query, level, n_gram) preprocessing results kept per instance
+    QUERY_CACHE_SIZE = 2048
+
+    # Edit distance vocab scores kept for threshold sweeps (one score row
+    # per query token and vocab term, so kept small)
+    SCORE_CACHE_SIZE = 32
+
     def __init__(
         self,
         db_path: Optional[str] = None,
         documents: Optional[List[Dict]] = None,
-        transliteration_map: Optional[Dict] = None
+        transliteration_map: Optional[Dict] = None,
+        lsh_threshold: Optional[float] = None
     ):
         """
         Initialize CLIR Search system.
@@ -51,11 +70,27 @@ class CLIRSearch:
             db_path (str): Path to SQLite database with documents
             documents (list): In-memory document list
             transliteration_map (dict): Mapping of terms to transliterations
+            lsh_threshold (float): If set (and datasketch is installed),
+                character 3-gram Jaccard searches with threshold at or above
+                this value only score candidates from a MinHash LSH index.
+                Faster on large corpora but approximate: a few true matches
+                may be missed. None always scans every document.
         """
         self.documents = []
         self.fuzzy_matcher = FuzzyMatcher()
+        self._token_indexes = {}
+        self._ngram_cache = {}
+        self._ngram_postings = {}
+        self._minhash_indexes = {}
+        self._score_cache = {}
+        self._indexed_count = 0
+        self.lsh_threshold = lsh_threshold if DATASKETCH_AVAILABLE else None
         self.bm25_retriever = None
+        self._bm25_stale = False
         self.transliteration_map = transliteration_map or {}
+        self._variant_index = None
+        # Bound per instance so cached entries do not outlive this object
+        self._prep_query = lru_cache(maxsize=self.QUERY_CACHE_SIZE)(self._prepare_query)
 
         # Load documents from database or memory
         if db_path:
@@ -65,7 +100,19 @@ class CLIRSearch:
         else:
             raise ValueError("Provide either db_path or documents list")
 
+        # Pre-compute tokens, vocab lengths and character histograms, and
+        # the default character 3-grams and their postings; other n-gram
+        # settings are built on first use
+        self._get_token_index(['title', 'body'])
+        self._get_ngram_postings(['title', 'body'], 'char', 3)
+        if self.lsh_threshold is not None:
+            self._get_minhash_index(['title', 'body'])
+
         # Initialize BM25 if available
+        self._init_bm25()
+
+    def _init_bm25(self) -> None:
+        """(Re)build the BM25 retriever over self.documents if BM25 is available."""
         if BM25_AVAILABLE:
             try:
                 self.bm25_retriever = BM25Retriever(
@@ -74,6 +121,9 @@ class CLIRSearch:
                 )
             except Exception as e:
                 print(f"Warning: Could not initialize BM25 retriever: {e}")
+                # Never search a retriever built over an older document set
+                self.bm25_retriever = None
+            self._bm25_stale = False
 
     def load_from_database(self, db_path: str) -> None:
         """
@@ -110,6 +160,175 @@ class CLIRSearch:
         conn.close()
         print(f"[OK] Loaded {len(self.documents)} documents from database")
 
+    def add_documents(self, documents: List[Dict]) -> None:
+        """
+        Add documents and update the precomputed indexes in place.
+
+        Only the new documents are tokenized and indexed. Extending
+        self.documents directly also works, but then every index is
+        rebuilt from scratch on the next search.
+
+        Args:
+            documents (list): New documents, same format as in __init__
+        """
+        # Pick up any direct changes to self.documents first
+        self._check_indexes_current()
+
+        start = len(self.documents)
+        self.documents.extend(documents)
+        self._indexed_count = len(self.documents)
+
+        for fields, token_index in self._token_indexes.items():
+            self.fuzzy_matcher.extend_token_index(token_index, documents, list(fields))
+
+        for key, ngram_index in self._ngram_cache.items():
+            level, n_gram, fields = key
+            new_ngrams = self.fuzzy_matcher.build_ngram_index(documents, list(fields), level, n_gram)
+            ngram_index.extend(new_ngrams)
+            if key in self._ngram_postings:
+                self.fuzzy_matcher.extend_ngram_postings(self._ngram_postings[key], new_ngrams)
+
+        for fields, lsh in self._minhash_indexes.items():
+            ngram_index = self._get_ngram_index(list(fields), 'char', self.LSH_NGRAM)
+            self._insert_minhashes(lsh, ngram_index, start)
+
+        # Cached vocab scores do not cover terms that are new to the vocab
+        self._score_cache.clear()
+
+        # Rebuilt on the next BM25 search, so bulk adds pay for one rebuild
+        if self.bm25_retriever:
+            self._bm25_stale = True
+
+    def _check_indexes_current(self) -> None:
+        """Drop precomputed indexes if documents were added since they were built."""
+        if self._indexed_count != len(self.documents):
+            self._token_indexes.clear()
+            self._ngram_cache.clear()
+            self._ngram_postings.clear()
+            self._minhash_indexes.clear()
+            self._score_cache.clear()
+            self._indexed_count = len(self.documents)
+
+    def _get_ngram_index(self, fields: List[str], level: str, n_gram: int) -> List:
+        """Get per-document, per-field n-gram frozensets for Jaccard search."""
+        self._check_indexes_current()
+
+        key = (level, n_gram, tuple(fields))
+        if key not in self._ngram_cache:
+            self._ngram_cache[key] = self.fuzzy_matcher.build_ngram_index(
+                self.documents, fields, level, n_gram
+            )
+        return self._ngram_cache[key]
+
+    def _get_ngram_postings(self, fields: List[str], level: str, n_gram: int) -> Optional[Dict]:
+        """Get the inverted n-gram index for vectorized Jaccard search (None without NumPy)."""
+        ngram_index = self._get_ngram_index(fields, level, n_gram)
+        if not NUMPY_AVAILABLE:
+            return None
+
+        key = (level, n_gram, tuple(fields))
+        if key not in self._ngram_postings:
+            self._ngram_postings[key] = self.fuzzy_matcher.build_ngram_postings(ngram_index)
+        return self._ngram_postings[key]
+
+    def _get_minhash_index(self, fields: List[str]) -> 'MinHashLSH':
+        """
+        Get the MinHash LSH index over character 3-grams of each document field.
+
+        Keys are (document position, field position) pairs.
+        """
+        self._check_indexes_current()
+
+        key = tuple(fields)
+        if key not in self._minhash_indexes:
+            lsh = MinHashLSH(threshold=self.lsh_threshold, num_perm=self.LSH_NUM_PERM)
+            ngram_index = self._get_ngram_index(fields, 'char', self.LSH_NGRAM)
+
+            self._insert_minhashes(lsh, ngram_index, 0)
+            self._minhash_indexes[key] = lsh
+        return self._minhash_indexes[key]
+
+    def _insert_minhashes(self, lsh: 'MinHashLSH', ngram_index: List, start: int) -> None:
+        """Insert the fields of documents from position start on into an LSH index."""
+        with lsh.insertion_session() as session:
+            for doc_idx in range(start, len(ngram_index)):
+                for field_idx, ngrams in enumerate(ngram_index[doc_idx]):
+                    # Empty n-gram sets have no meaningful signature
+                    if ngrams:
+                        session.insert((doc_idx, field_idx), self._minhash(ngrams))
+
+    def _minhash(self, ngrams) -> 'MinHash':
+        """Build a MinHash signature for a set of n-grams."""
+        minhash = MinHash(num_perm=self.LSH_NUM_PERM)
+        minhash.update_batch([g.encode('utf-8') for g in ngrams])
+        return minhash
+
+    def _prepare_query(
+        self,
+        query: str,
+        level: str = 'char',
+        n_gram: int = 3
+    ) -> Tuple[Tuple[str, ...], FrozenSet[str]]:
+        """
+        Tokenize a query and build its n-grams.
+
+        Called through self._prep_query, which caches results so threshold
+        sweeps and hybrid searches preprocess each query once.
+
+        Returns:
+            tuple: (query tokens, query n-grams for level and n_gram)
+        """
+        tokens = tuple(self.fuzzy_matcher.tokenize(query))
+        if level == 'char':
+            ngrams = self.fuzzy_matcher.character_ngrams(query, n=n_gram)
+        else:
+            ngrams = self.fuzzy_matcher.word_ngrams(list(tokens), n=n_gram)
+        return tokens, frozenset(ngrams)
+
+    def _get_token_index(self, fields: List[str]) -> Dict:
+        """
+        Get the edit distance token index for the given fields.
+
+        Indexes are built once per field list and rebuilt if documents
+        were added since.
+        """
+        self._check_indexes_current()
+
+        key = tuple(fields)
+        if key not in self._token_indexes:
+            self._token_indexes[key] = self.fuzzy_matcher.build_token_index(
+                self.documents, fields
+            )
+        return self._token_indexes[key]
+
+    def _get_scored_vocab(
+        self,
+        query_tokens: Tuple[str, ...],
+        fields: List[str],
+        threshold: float
+    ) -> Tuple:
+        """
+        Get edit distance vocab scores for a query.
+
+        Scores computed at a threshold stay valid for any higher one, so
+        a cached entry is reused unless this threshold is lower.
+        """
+        token_index = self._get_token_index(fields)
+
+        key = (query_tokens, tuple(fields))
+        cached = self._score_cache.get(key)
+        if cached is not None and cached[0] <= threshold:
+            return cached[1]
+
+        scored_vocab = self.fuzzy_matcher.score_vocab(list(query_tokens), token_index, threshold)
+
+        # Evict the oldest entry; dicts keep insertion order
+        self._score_cache.pop(key, None)
+        if len(self._score_cache) >= self.SCORE_CACHE_SIZE:
+            del self._score_cache[next(iter(self._score_cache))]
+        self._score_cache[key] = (threshold, scored_vocab)
+        return scored_vocab
+
     def search_bm25(
         self,
         query: str,
@@ -130,6 +349,11 @@ class CLIRSearch:
         if not self.bm25_retriever:
             return []
 
+        if self._bm25_stale:
+            self._init_bm25()
+            if not self.bm25_retriever:
+                return []
+
         try:
             results = self.bm25_retriever.search(
                 query=query,
@@ -160,13 +384,24 @@ class CLIRSearch:
         Returns:
             list: Top-k results with edit distance scores
         """
+        query_tokens, _ = self._prep_query(query)
+        token_index = self._get_token_index(fields)
+
+        # Token indexes built without NumPy have no vocab to score
+        scored_vocab = None
+        if query_tokens and 'vocab' in token_index:
+            scored_vocab = self._get_scored_vocab(query_tokens, fields, threshold)
+
         return self.fuzzy_matcher.search_with_edit_distance(
             query=query,
             documents=self.documents,
             fields=fields,
             threshold=threshold,
             top_k=top_k,
-            include_snippet=True
+            include_snippet=True,
+            token_index=token_index,
+            query_tokens=list(query_tokens),
+            scored_vocab=scored_vocab
         )
 
     def search_jaccard(
@@ -192,6 +427,20 @@ class CLIRSearch:
         Returns:
             list: Top-k results with Jaccard scores
         """
+        _, query_ngrams = self._prep_query(query, level, n_gram)
+
+        candidate_docs = None
+        if (
+            self.lsh_threshold is not None
+            and level == 'char'
+            and n_gram == self.LSH_NGRAM
+            and threshold >= self.lsh_threshold
+        ):
+            # An empty query can only match empty fields, which are not indexed
+            if query_ngrams:
+                lsh = self._get_minhash_index(fields)
+                candidate_docs = {doc_idx for doc_idx, _ in lsh.query(self._minhash(query_ngrams))}
+
         return self.fuzzy_matcher.search_with_jaccard(
             query=query,
             documents=self.documents,
@@ -200,7 +449,11 @@ class CLIRSearch:
             n_gram=n_gram,
             threshold=threshold,
             top_k=top_k,
-            include_snippet=True
+            include_snippet=True,
+            ngram_index=self._get_ngram_index(fields, level, n_gram),
+            candidate_docs=candidate_docs,
+            query_ngrams=query_ngrams,
+            ngram_postings=self._get_ngram_postings(fields, level, n_gram)
         )
 
     def search_transliteration(
@@ -209,7 +462,7 @@ class CLIRSearch:
         threshold: float = 0.75,
         top_k: int = 10,
         fields: List[str] = ['title', 'body']
-    ) -> List[Dict]:
+    ) -> List[TransliterationResult]:
         """
         Search using transliteration-aware fuzzy matching.
         
@@ -220,21 +473,28 @@ class CLIRSearch:
             fields (list): Document fields to search
             
         Returns:
-            list: Top-k results with transliteration-aware scores
+            list: Top-k TransliterationResult tuples. This holds for an
+            empty transliteration map too: only the original query is
+            searched and every hit has variant_matches == 1, but the
+            results are not the dicts returned by search_edit_distance.
         """
-        if not self.transliteration_map:
-            # Fall back to edit distance if no transliteration map
-            return self.search_edit_distance(query, threshold, top_k, fields)
-
         return self.fuzzy_matcher.search_with_transliteration(
             query=query,
             documents=self.documents,
             transliteration_map=self.transliteration_map,
             fields=fields,
             threshold=threshold,
-            top_k=top_k
+            top_k=top_k,
+            token_index=self._get_token_index(fields),
+            variant_index=self._get_variant_index()
         )
 
+    def _get_variant_index(self) -> Dict[str, str]:
+        """Return the variant -> original index for the transliteration map, building it on first use."""
+        if self._variant_index is None:
+            self._variant_index = self.fuzzy_matcher.build_variant_index(self.transliteration_map)
+        return self._variant_index
+
     def _normalize_scores(self, results: List[Dict], score_field: str) -> List[Dict]:
         """
         Normalize scores to [0, 1] range.
@@ -314,9 +574,9 @@ class CLIRSearch:
 
         # BM25 search
         if weights.get('bm25', 0) > 0 and self.bm25_retriever:
-            start = time.time()
+            start = time.perf_counter()
             bm25_results = self.search_bm25(query, top_k=top_k * 2)
-            timing['bm25'] = time.time() - start
+            timing['bm25'] = time.perf_counter() - start
             bm25_results = self._normalize_scores(bm25_results, 'bm25_score')
             results_by_method['bm25'] = {r['doc_id']: r for r in bm25_results}
             if verbose:
@@ -326,13 +586,13 @@ class CLIRSearch:
 
         # Edit distance search
         if weights.get('edit', 0) > 0:
-            start = time.time()
+            start = time.perf_counter()
             edit_results = self.search_edit_distance(
                 query,
                 threshold=thresholds.get('edit', 0.75),
                 top_k=top_k * 2
             )
-            timing['edit'] = time.time() - start
+            timing['edit'] = time.perf_counter() - start
             edit_results = self._normalize_scores(edit_results, 'fuzzy_score')
             results_by_method['edit'] = {r['doc_id']: r for r in edit_results}
             if verbose:
@@ -342,13 +602,13 @@ class CLIRSearch:
 
         # Jaccard similarity search
         if weights.get('jaccard', 0) > 0:
-            start = time.time()
+            start = time.perf_counter()
             jaccard_results = self.search_jaccard(
                 query,
                 threshold=thresholds.get('jaccard', 0.3),
                 top_k=top_k * 2
             )
-            timing['jaccard'] = time.time() - start
+            timing['jaccard'] = time.perf_counter() - start
             jaccard_results = self._normalize_scores(jaccard_results, 'jaccard_score')
             results_by_method['jaccard'] = {r['doc_id']: r for r in jaccard_results}
             if verbose:
@@ -392,7 +652,7 @@ class CLIRSearch:
 
         # Sort by combined score
         final_results = []
-        for doc_id, combined_score in sorted(combined_scores.items(), key=lambda x: x[1], reverse=True)[:top_k]:
+        for doc_id, combined_score in heapq.nlargest(top_k, combined_scores.items(), key=lambda x: x[1]):
             result = doc_details[doc_id].copy()
             result['hybrid_score'] = combined_score
             final_results.append(result)
@@ -429,11 +689,11 @@ class CLIRSearch:
 
         # BM25
         if self.bm25_retriever:
-            start = time.time()
+            start = time.perf_counter()
             bm25_results = self.search_bm25(query, top_k=top_k)
             results['methods']['bm25'] = {
                 'results': bm25_results,
-                'time': time.time() - start,
+                'time': time.perf_counter() - start,
                 'count': len(bm25_results)
             }
         else:
@@ -445,29 +705,29 @@ class CLIRSearch:
             }
 
         # Edit Distance
-        start = time.time()
+        start = time.perf_counter()
         edit_results = self.search_edit_distance(query, top_k=top_k)
         results['methods']['edit_distance'] = {
             'results': edit_results,
-            'time': time.time() - start,
+            'time': time.perf_counter() - start,
             'count': len(edit_results)
         }
 
         # Jaccard
-        start = time.time()
+        start = time.perf_counter()
         jaccard_results = self.search_jaccard(query, top_k=top_k)
         results['methods']['jaccard'] = {
             'results': jaccard_results,
-            'time': time.time() - start,
+            'time': time.perf_counter() - start,
             'count': len(jaccard_results)
         }
 
         # Hybrid
-        start = time.time()
+        start = time.perf_counter()
         hybrid_results, hybrid_timing = self.hybrid_search(query, top_k=top_k)
         results['methods']['hybrid'] = {
             'results': hybrid_results,
-            'time': time.time() - start,
+            'time': time.perf_counter() - start,
             'count': len(hybrid_results)
         }
 
@@ -501,3 +761,4 @@ class CLIRSearch:
             transliteration_map (dict): Mapping of terms to variants
         """
         self.transliteration_map = transliteration_map
+        self._variant_index = None
@@ -9,10 +9,34 @@ Implements:
 """
 
 import re
-from typing import List, Dict, Set, Tuple, Optional
+import heapq
+import itertools
+from typing import List, Dict, Set, FrozenSet, Tuple, Optional, Iterable, NamedTuple
 from collections import defaultdict
-import math
-import time
+
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+try:
+    # RapidFuzz computes Levenshtein with a bit-parallel algorithm in C++
+    from rapidfuzz import process
+    from rapidfuzz.distance import Levenshtein
+    RAPIDFUZZ_AVAILABLE = True
+except ImportError:
+    RAPIDFUZZ_AVAILABLE = False
+
+# Word tokens; compiled once since every document field is tokenized
+_TOKEN_PATTERN = re.compile(r'\w+', re.UNICODE)
+
+try:
+    # joblib spreads large NumPy edit distance batches over threads
+    from joblib import Parallel, delayed
+    JOBLIB_AVAILABLE = True
+except ImportError:
+    JOBLIB_AVAILABLE = False
 
 try:
     from Levenshtein import distance as levenshtein_distance
@@ -38,6 +62,134 @@ except ImportError:
         return previous_row[-1]
 
 
+def _edit_distance(s1: str, s2: str) -> int:
+    """Levenshtein distance using the fastest available implementation."""
+    if RAPIDFUZZ_AVAILABLE:
+        return Levenshtein.distance(s1, s2)
+    return levenshtein_distance(s1, s2)
+
+
+def _bounded_edit_distance(s1: str, s2: str, max_distance: int) -> int:
+    """
+    Levenshtein distance if it is at most max_distance, else max_distance + 1.
+
+    Without RapidFuzz only cells within max_distance of the diagonal are
+    computed (Ukkonen's band), and the scan stops once a whole row is
+    over the bound.
+    """
+    if RAPIDFUZZ_AVAILABLE:
+        return Levenshtein.distance(s1, s2, score_cutoff=max_distance)
+
+    if len(s1) < len(s2):
+        s1, s2 = s2, s1
+    over = max_distance + 1
+    if len(s1) - len(s2) > max_distance:
+        return over
+    if len(s2) == 0:
+        return len(s1)
+
+    # Cells outside the band are at least |i - j| > max_distance
+    previous_row = [j if j <= max_distance else over for j in range(len(s2) + 1)]
+    for i, c1 in enumerate(s1, 1):
+        current_row = [over] * (len(s2) + 1)
+        current_row[0] = i if i <= max_distance else over
+        row_min = current_row[0]
+        for j in range(max(1, i - max_distance), min(len(s2), i + max_distance) + 1):
+            value = min(
+                previous_row[j] + 1,
+                current_row[j - 1] + 1,
+                previous_row[j - 1] + (c1 != s2[j - 1])
+            )
+            current_row[j] = min(value, over)
+            row_min = min(row_min, current_row[j])
+        if row_min > max_distance:
+            return over
+        previous_row = current_row
+
+    return previous_row[-1]
+
+
+class BKTree:
+    """
+    Burkhard-Keller tree for edit distance range queries over a vocabulary.
+
+    Children are keyed by their distance to the parent, so the triangle
+    inequality lets find() skip every subtree outside
+    [d - max_distance, d + max_distance].
+    """
+
+    def __init__(self, distance_fn, items: Iterable[str] = ()):
+        """
+        Initialize BKTree.
+
+        Args:
+            distance_fn (callable): Metric distance between two items
+            items (iterable): Initial items to insert
+        """
+        self.distance_fn = distance_fn
+        self.root = None  # (item, {distance: child_node})
+        for item in items:
+            self.add(item)
+
+    def add(self, item: str) -> None:
+        """Insert an item (duplicates are ignored)."""
+        if self.root is None:
+            self.root = (item, {})
+            return
+
+        node_item, children = self.root
+        while True:
+            distance = self.distance_fn(item, node_item)
+            if distance == 0:
+                return
+            child = children.get(distance)
+            if child is None:
+                children[distance] = (item, {})
+                return
+            node_item, children = child
+
+    def find(self, item: str, max_distance: int) -> List[Tuple[int, str]]:
+        """
+        Find all items within max_distance of item.
+
+        Returns:
+            list: (distance, item) pairs in no particular order
+        """
+        found = []
+        if self.root is None:
+            return found
+
+        stack = [self.root]
+        while stack:
+            node_item, children = stack.pop()
+            distance = self.distance_fn(item, node_item)
+            if distance <= max_distance:
+                found.append((distance, node_item))
+
+            low, high = distance - max_distance, distance + max_distance
+            for child_distance, child in children.items():
+                if low <= child_distance <= high:
+                    stack.append(child)
+
+        return found
+
+
+class TransliterationResult(NamedTuple):
+    """
+    Ranked result of a transliteration-aware search.
+
+    A tuple rather than a dict: results are created for every matching
+    document of every query variant, and fields are read by attribute.
+    """
+    doc_id: int
+    title: str
+    url: str
+    language: str
+    fuzzy_score: float
+    variant_matches: int
+    snippet: str = ''
+
+
 class FuzzyMatcher:
     """
     Core fuzzy matching class for CLIR system.
@@ -49,6 +201,12 @@ class FuzzyMatcher:
     - Token-level and document-level matching
     """
 
+    # Candidates per edit_distance_batch call on the NumPy fallback path
+    BATCH_CHUNK_SIZE = 2048
+    # Lowest threshold at which score_vocab walks a BK-tree instead of
+    # scanning; below it the search radius covers most of the tree
+    BKTREE_MIN_THRESHOLD = 0.9
+
     def __init__(self, language: str = 'en'):
         """
         Initialize FuzzyMatcher.
@@ -69,13 +227,11 @@ class FuzzyMatcher:
         Returns:
             list: List of tokens (lowercase)
         """
-        # Remove special characters and split by whitespace
-        text = text.lower()
-        # Keep alphanumeric and some special chars for Bangla
-        tokens = re.findall(r'\w+', text, re.UNICODE)
-        return [t for t in tokens if len(t) > 0]
+        # Keep alphanumeric runs (including Bangla letters and signs);
+        # \w+ never yields empty tokens
+        return _TOKEN_PATTERN.findall(text.lower())
 
-    def edit_distance_score(self, s1: str, s2: str) -> float:
+    def edit_distance_score(self, s1: str, s2: str, score_cutoff: float = 0.0) -> float:
         """
         Calculate normalized edit distance similarity score.
         
@@ -84,6 +240,8 @@ class FuzzyMatcher:
         Args:
             s1 (str): First string
             s2 (str): Second string
+            score_cutoff (float): Scores below this are returned as 0.0,
+                which lets the distance computation stop early
             
         Returns:
             float: Similarity score in range [0, 1], where 1 is identical
@@ -95,9 +253,92 @@ class FuzzyMatcher:
         if max_len == 0:
             return 1.0
 
-        distance = levenshtein_distance(s1, s2)
+        if score_cutoff <= 0.0:
+            distance = _edit_distance(s1, s2)
+        else:
+            # Largest distance whose score can still reach score_cutoff
+            max_distance = int((1.0 - score_cutoff) * max_len + 1e-9)
+            distance = _bounded_edit_distance(s1, s2, max_distance)
+            if distance > max_distance:
+                return 0.0
+
         return 1.0 - (distance / max_len)
 
+    def edit_distance_batch(self, query: str, candidates: List[str]) -> 'np.ndarray':
+        """
+        Calculate normalized edit distance similarity of one query against
+        many candidates at once (requires NumPy).
+
+        Runs Wagner-Fischer over all candidates in parallel: each query
+        character updates a whole DP row for every candidate. The in-row
+        insertion dependency is resolved with a running minimum, so each
+        row costs a constant number of NumPy operations.
+
+        Args:
+            query (str): Query string
+            candidates (list): Strings to compare against
+
+        Returns:
+            np.ndarray: Similarity scores in range [0, 1], one per candidate
+        """
+        query = query.lower()
+        candidates = [c.lower() for c in candidates]
+
+        num = len(candidates)
+        if num == 0:
+            return np.zeros(0, dtype=np.float64)
+
+        lengths = np.fromiter((len(c) for c in candidates), dtype=np.int32, count=num)
+        max_len = int(lengths.max())
+
+        # Code points padded to a uniform width; padding is never read
+        # because each candidate's distance is taken at its own length
+        chars = np.zeros((num, max_len), dtype=np.uint32)
+        for idx, cand in enumerate(candidates):
+            if cand:
+                chars[idx, :len(cand)] = np.frombuffer(cand.encode('utf-32-le'), dtype=np.uint32)
+
+        cols = np.arange(max_len + 1, dtype=np.int32)
+        prev = np.broadcast_to(cols, (num, max_len + 1)).copy()
+
+        for i, q in enumerate(query, 1):
+            cost = (chars != ord(q)).astype(np.int32)
+            curr = np.empty_like(prev)
+            curr[:, 0] = i
+            # Deletion and substitution only look at the previous row
+            np.minimum(prev[:, 1:] + 1, prev[:, :-1] + cost, out=curr[:, 1:])
+            # Insertion: curr[j] = min_k<=j (curr[k] + j - k)
+            curr = np.minimum.accumulate(curr - cols, axis=1) + cols
+            prev = curr
+
+        distances = prev[np.arange(num), lengths]
+        max_lens = np.maximum(lengths, len(query))
+        scores = np.ones(num, dtype=np.float64)
+        nonempty = max_lens > 0
+        scores[nonempty] = 1.0 - distances[nonempty] / max_lens[nonempty]
+        return scores
+
+    def _edit_distance_batch_chunked(self, query: str, candidates: List[str]) -> 'np.ndarray':
+        """
+        edit_distance_batch over fixed-size chunks of candidates.
+
+        Chunks keep the padded character matrix small, and with joblib
+        they are scored on parallel threads: NumPy releases the GIL inside
+        the row updates, so no process pool or pickling is needed.
+        """
+        size = self.BATCH_CHUNK_SIZE
+        if len(candidates) <= size:
+            return self.edit_distance_batch(query, candidates)
+
+        chunks = [candidates[i:i + size] for i in range(0, len(candidates), size)]
+        if JOBLIB_AVAILABLE:
+            parts = Parallel(n_jobs=-1, prefer='threads')(
+                delayed(self.edit_distance_batch)(query, chunk) for chunk in chunks
+            )
+        else:
+            parts = [self.edit_distance_batch(query, chunk) for chunk in chunks]
+        return np.concatenate(parts)
+
     def character_ngrams(self, text: str, n: int = 3) -> Set[str]:
         """
         Generate character n-grams from text.
@@ -116,9 +357,7 @@ class FuzzyMatcher:
         if cache_key in self.ngram_cache:
             return self.ngram_cache[cache_key]
 
-        ngrams = set()
-        for i in range(len(text) - n + 1):
-            ngrams.add(text[i:i + n])
+        ngrams = {text[i:i + n] for i in range(len(text) - n + 1)}
 
         self.ngram_cache[cache_key] = ngrams
         return ngrams
@@ -134,10 +373,9 @@ class FuzzyMatcher:
         Returns:
             set: Set of word n-grams
         """
-        ngrams = set()
-        for i in range(len(tokens) - n + 1):
-            ngrams.add(' '.join(tokens[i:i + n]))
-        return ngrams
+        if n == 1:
+            return set(tokens)
+        return {' '.join(tokens[i:i + n]) for i in range(len(tokens) - n + 1)}
 
     def jaccard_similarity(self, set1: Set[str], set2: Set[str]) -> float:
         """
@@ -157,13 +395,246 @@ class FuzzyMatcher:
         if not set1 or not set2:
             return 0.0
 
+        # |A | B| = |A| + |B| - |A & B| avoids building the union set
         intersection = len(set1 & set2)
-        union = len(set1 | set2)
+        return intersection / (len(set1) + len(set2) - intersection)
 
-        if union == 0:
-            return 0.0
+    def char_histogram(self, text: str) -> 'np.ndarray':
+        """
+        Bag-of-characters histogram of text (requires NumPy).
+
+        Code points are folded into 256 bins (ASCII and the Bangla block
+        land in disjoint halves). Folding can only merge counts, so
+        histogram differences remain a lower bound on edit distance.
+
+        Args:
+            text (str): Text to count characters of
+
+        Returns:
+            np.ndarray: int32 array of 256 character counts
+        """
+        codes = np.frombuffer(text.encode('utf-32-le'), dtype=np.uint32)
+        return np.bincount(codes & 0xFF, minlength=256).astype(np.int32)
+
+    def build_token_index(
+        self,
+        documents: List[Dict],
+        fields: List[str] = ['title', 'body'],
+        build_bktree: bool = False
+    ) -> Dict:
+        """
+        Pre-compute the token data used by edit distance search.
+        
+        Args:
+            documents (list): Document list
+            fields (list): Document fields to process
+            build_bktree (bool): Also build a BK-tree over the vocab. It is
+                only used with RapidFuzz at thresholds of at least
+                BKTREE_MIN_THRESHOLD and rarely beats the vectorized scan
+                even there, so it is off by default.
+            
+        Returns:
+            dict: 'field_tokens' (tokens per document and field) and, when
+                NumPy is available, 'vocab' (distinct tokens), 'vocab_ids',
+                'columns' (vocab position of every token in order),
+                'doc_offsets' (first column of each document), 'lengths' and
+                'histograms' of the vocab, and optionally 'bktree'
+        """
+        token_index = {'field_tokens': []}
+
+        if NUMPY_AVAILABLE:
+            token_index.update({
+                'vocab_ids': {},
+                'vocab': np.empty(0, dtype=object),
+                'columns': np.empty(0, dtype=np.intp),
+                'doc_offsets': np.empty(0, dtype=np.intp),
+                'lengths': np.empty(0, dtype=np.int32),
+                'histograms': np.empty((0, 256), dtype=np.int32)
+            })
+            if build_bktree:
+                token_index['bktree'] = BKTree(_edit_distance)
+
+        self.extend_token_index(token_index, documents, fields)
+        return token_index
+
+    def extend_token_index(
+        self,
+        token_index: Dict,
+        documents: List[Dict],
+        fields: List[str] = ['title', 'body']
+    ) -> None:
+        """
+        Append documents to a token index from build_token_index() in place.
+
+        Only the new documents are tokenized; vocab ids of existing terms
+        are kept, so columns already in the index stay valid.
+
+        Args:
+            token_index (dict): Index to extend
+            documents (list): Documents to append, in order
+            fields (list): Same fields the index was built with
+        """
+        field_tokens = [
+            [self.tokenize(str(doc.get(field, ''))) for field in fields]
+            for doc in documents
+        ]
+        token_index['field_tokens'].extend(field_tokens)
+
+        # Indexes built without NumPy only hold the tokens
+        if 'vocab' not in token_index:
+            return
+
+        vocab = token_index['vocab_ids']
+        num_known = len(vocab)
+        num_tokens = sum(len(tokens) for doc_fields in field_tokens for tokens in doc_fields)
+        columns = np.fromiter(
+            (vocab.setdefault(t, len(vocab))
+             for doc_fields in field_tokens for tokens in doc_fields for t in tokens),
+            dtype=np.intp,
+            count=num_tokens
+        )
+        # Dicts keep insertion order, so new terms are the last keys
+        new_terms = list(itertools.islice(reversed(vocab), len(vocab) - num_known))[::-1]
+
+        doc_sizes = np.fromiter(
+            (sum(len(tokens) for tokens in doc_fields) for doc_fields in field_tokens),
+            dtype=np.intp,
+            count=len(field_tokens)
+        )
+        doc_offsets = len(token_index['columns']) + np.cumsum(doc_sizes) - doc_sizes
+
+        token_index['vocab'] = np.concatenate([
+            token_index['vocab'], np.array(new_terms, dtype=object)
+        ])
+        token_index['columns'] = np.concatenate([token_index['columns'], columns])
+        token_index['doc_offsets'] = np.concatenate([token_index['doc_offsets'], doc_offsets])
+        token_index['lengths'] = np.concatenate([
+            token_index['lengths'],
+            np.fromiter((len(t) for t in new_terms), dtype=np.int32, count=len(new_terms))
+        ])
+        token_index['histograms'] = np.concatenate([
+            token_index['histograms'],
+            np.array([self.char_histogram(t) for t in new_terms], dtype=np.int32)
+            .reshape(len(new_terms), 256)
+        ])
+
+        if 'bktree' in token_index:
+            for term in new_terms:
+                token_index['bktree'].add(term)
+
+    def _edit_distance_prefilter(
+        self,
+        query_token: str,
+        lengths: 'np.ndarray',
+        histograms: 'np.ndarray',
+        threshold: float
+    ) -> 'np.ndarray':
+        """
+        Mask of candidates whose edit distance score can reach threshold.
+
+        A score >= threshold allows at most (1 - threshold) * max_len edits.
+        Both the length difference and half the bag-of-characters distance
+        are lower bounds on edit distance, so rejected candidates can never
+        match.
+        """
+        query_len = len(query_token)
+        budget = (1.0 - threshold) * np.maximum(lengths, query_len) + 1e-9
+
+        mask = np.abs(lengths - query_len) <= budget
+        if mask.any():
+            query_hist = self.char_histogram(query_token)
+            bag_bound = np.abs(histograms[mask] - query_hist).sum(axis=1) / 2
+            mask[mask] = bag_bound <= budget[mask]
+        return mask
+
+    def score_vocab(
+        self,
+        query_tokens: List[str],
+        token_index: Dict,
+        threshold: float
+    ) -> Tuple['np.ndarray', Optional[List[int]]]:
+        """
+        Edit distance scores of query tokens against an index's vocab
+        (requires NumPy).
+
+        Scores are exact for every (query token, vocab term) pair that can
+        reach threshold; pairs that cannot may be left at 0. The result is
+        therefore also valid for any higher threshold, which lets callers
+        reuse it across threshold sweeps.
 
-        return intersection / union
+        Args:
+            query_tokens (list): Tokenized query
+            token_index (dict): Index from build_token_index()
+            threshold (float): Minimum similarity score [0, 1]
+
+        Returns:
+            tuple: (scores of shape (len(query_tokens), len(vocab)),
+                positions of the only documents that can match, or None
+                if every document must be checked)
+        """
+        # Score all query tokens against the distinct document tokens;
+        # each (document, field) pair owns a contiguous column range
+        vocab = token_index['vocab']
+        vocab_scores = np.zeros((len(query_tokens), len(vocab)), dtype=np.float64)
+        bktree = token_index.get('bktree')
+        # Without RapidFuzz every tree node costs a pure-Python distance
+        use_bktree = (
+            bktree is not None
+            and RAPIDFUZZ_AVAILABLE
+            and threshold >= self.BKTREE_MIN_THRESHOLD
+        )
+
+        for query_idx, query_token in enumerate(query_tokens):
+            if use_bktree:
+                # score >= threshold implies distance <= (1 - t) * len(q) / t
+                max_distance = int((1.0 - threshold) * len(query_token) / threshold + 1e-9)
+                for distance, term in bktree.find(query_token, max_distance):
+                    max_len = max(len(query_token), len(term))
+                    vocab_scores[query_idx, token_index['vocab_ids'][term]] = 1.0 - distance / max_len
+                continue
+
+            # Only candidates that can still reach the threshold are scored
+            survivors = np.flatnonzero(self._edit_distance_prefilter(
+                query_token,
+                token_index['lengths'],
+                token_index['histograms'],
+                threshold
+            ))
+            if len(survivors) == 0:
+                continue
+            candidates = vocab[survivors].tolist()
+
+            if RAPIDFUZZ_AVAILABLE:
+                # Raw distances keep the score arithmetic identical to
+                # edit_distance_score at threshold boundaries. The cutoff is
+                # the budget of the longest candidate; distances over it
+                # come back as cutoff + 1, which scores below threshold for
+                # every candidate
+                max_lens = np.maximum(token_index['lengths'][survivors], len(query_token))
+                distances = process.cdist(
+                    [query_token],
+                    candidates,
+                    scorer=Levenshtein.distance,
+                    dtype=np.int32,
+                    workers=-1,
+                    score_cutoff=int((1.0 - threshold) * int(max_lens.max()) + 1e-9)
+                )[0]
+                vocab_scores[query_idx, survivors] = 1.0 - distances / max_lens
+            else:
+                vocab_scores[query_idx, survivors] = self._edit_distance_batch_chunked(
+                    query_token, candidates
+                )
+
+        doc_indices = None
+        if use_bktree:
+            # Only documents containing a matched term can produce results
+            matched = np.flatnonzero((vocab_scores >= threshold).any(axis=0))
+            positions = np.flatnonzero(np.isin(token_index['columns'], matched))
+            doc_indices = np.unique(
+                np.searchsorted(token_index['doc_offsets'], positions, side='right') - 1
+            ).tolist()
+
+        return vocab_scores, doc_indices
 
     def search_with_edit_distance(
         self,
@@ -172,7 +643,10 @@ class FuzzyMatcher:
         fields: List[str] = ['title', 'body'],
         threshold: float = 0.75,
         top_k: Optional[int] = None,
-        include_snippet: bool = True
+        include_snippet: bool = True,
+        token_index: Optional[Dict] = None,
+        query_tokens: Optional[List[str]] = None,
+        scored_vocab: Optional[Tuple] = None
     ) -> List[Dict]:
         """
         Search documents using edit distance for fuzzy matching.
@@ -184,6 +658,12 @@ class FuzzyMatcher:
             threshold (float): Minimum similarity score [0, 1]
             top_k (int): Return top-k results (None = all above threshold)
             include_snippet (bool): Include text snippet in results
+            token_index (dict): Prebuilt index from build_token_index() for
+                the same documents and fields (built on the fly if None)
+            query_tokens (list): Pre-tokenized query (tokenized here if None)
+            scored_vocab (tuple): Result of score_vocab() for the same query
+                tokens and token_index at a threshold no higher than this
+                one (computed here if None)
             
         Returns:
             list: Ranked results with edit distance scores
@@ -196,62 +676,92 @@ class FuzzyMatcher:
             ...     threshold=0.75
             ... )
         """
-        query_tokens = self.tokenize(query)
+        if query_tokens is None:
+            query_tokens = self.tokenize(query)
+        scored = []  # (score, document position, matched terms)
         results = []
 
-        for doc_idx, doc in enumerate(documents):
+        if token_index is None:
+            token_index = self.build_token_index(documents, fields)
+        field_tokens = token_index['field_tokens']
+
+        vocab_scores = None
+        doc_indices = range(len(documents))
+        if NUMPY_AVAILABLE and query_tokens:
+            if scored_vocab is None:
+                scored_vocab = self.score_vocab(query_tokens, token_index, threshold)
+            vocab_scores, matched_docs = scored_vocab
+            if matched_docs is not None:
+                doc_indices = matched_docs
+
+        for doc_idx in doc_indices:
             best_matches = []
-            max_score = 0.0
 
-            for query_token in query_tokens:
-                token_scores = []
+            # Column range of each field's tokens within token_index['columns']
+            field_spans = []
+            offset = int(token_index['doc_offsets'][doc_idx]) if vocab_scores is not None else 0
+            for doc_tokens in field_tokens[doc_idx]:
+                field_spans.append((doc_tokens, offset, offset + len(doc_tokens)))
+                offset += len(doc_tokens)
 
+            for query_idx, query_token in enumerate(query_tokens):
                 # Search in specified fields
-                for field in fields:
-                    field_text = str(doc.get(field, '')).lower()
-                    doc_tokens = self.tokenize(field_text)
-
+                for doc_tokens, start, end in field_spans:
                     # Find best match for this query token
                     best_field_score = 0.0
                     best_doc_token = None
 
-                    for doc_token in doc_tokens:
-                        score = self.edit_distance_score(query_token, doc_token)
-                        if score > best_field_score:
-                            best_field_score = score
-                            best_doc_token = doc_token
+                    if vocab_scores is not None:
+                        if doc_tokens:
+                            row = vocab_scores[query_idx, token_index['columns'][start:end]]
+                            best_idx = int(row.argmax())
+                            if row[best_idx] > 0.0:
+                                best_field_score = float(row[best_idx])
+                                best_doc_token = doc_tokens[best_idx]
+                    else:
+                        for doc_token in doc_tokens:
+                            # Length difference alone already exceeds the budget
+                            max_len = max(len(query_token), len(doc_token))
+                            if abs(len(query_token) - len(doc_token)) > (1.0 - threshold) * max_len + 1e-9:
+                                continue
+                            score = self.edit_distance_score(query_token, doc_token, threshold)
+                            if score > best_field_score:
+                                best_field_score = score
+                                best_doc_token = doc_token
 
                     if best_field_score >= threshold:
-                        token_scores.append((query_token, best_doc_token, best_field_score))
                         best_matches.append((query_token, best_doc_token, best_field_score))
 
-                max_score = max(max_score, best_field_score)
-
             if best_matches:
                 # Average score of all matched tokens
                 avg_score = sum(m[2] for m in best_matches) / len(best_matches)
+                scored.append((avg_score, doc_idx, best_matches))
 
-                result = {
-                    'doc_id': doc.get('doc_id', doc_idx),
-                    'title': doc.get('title', ''),
-                    'url': doc.get('url', ''),
-                    'language': doc.get('language', 'unknown'),
-                    'fuzzy_score': avg_score,
-                    'matched_terms': best_matches,
-                    'num_matches': len(best_matches)
-                }
-
-                if include_snippet:
-                    body = str(doc.get('body', ''))[:200]
-                    result['snippet'] = body + ('...' if len(body) == 200 else '')
-
-                results.append(result)
-
-        # Sort by score descending
-        results.sort(key=lambda x: x['fuzzy_score'], reverse=True)
-
+        # Sort by score descending; result dicts are built only for the
+        # documents that survive the top_k cut. nlargest keeps sort order
+        # (ties by document position) without sorting every match
         if top_k:
-            results = results[:top_k]
+            scored = heapq.nlargest(top_k, scored, key=lambda x: x[0])
+        else:
+            scored.sort(key=lambda x: x[0], reverse=True)
+
+        for avg_score, doc_idx, best_matches in scored:
+            doc = documents[doc_idx]
+            result = {
+                'doc_id': doc.get('doc_id', doc_idx),
+                'title': doc.get('title', ''),
+                'url': doc.get('url', ''),
+                'language': doc.get('language', 'unknown'),
+                'fuzzy_score': avg_score,
+                'matched_terms': best_matches,
+                'num_matches': len(best_matches)
+            }
+
+            if include_snippet:
+                body = str(doc.get('body', ''))[:200]
+                result['snippet'] = body + ('...' if len(body) == 200 else '')
+
+            results.append(result)
 
         return results
 
@@ -264,7 +774,11 @@ class FuzzyMatcher:
         n_gram: int = 3,
         threshold: float = 0.3,
         top_k: Optional[int] = None,
-        include_snippet: bool = True
+        include_snippet: bool = True,
+        ngram_index: Optional[List[List[FrozenSet[str]]]] = None,
+        candidate_docs: Optional[Iterable[int]] = None,
+        query_ngrams: Optional[Set[str]] = None,
+        ngram_postings: Optional[Dict] = None
     ) -> List[Dict]:
         """
         Search documents using Jaccard similarity.
@@ -278,6 +792,15 @@ class FuzzyMatcher:
             threshold (float): Minimum Jaccard score [0, 1]
             top_k (int): Return top-k results
             include_snippet (bool): Include text snippet
+            ngram_index (list): Prebuilt n-grams from build_ngram_index() for
+                the same documents, fields, level and n_gram
+            candidate_docs (iterable): Only score documents at these positions
+                (e.g. from an LSH lookup); None scores all documents
+            query_ngrams (set): Precomputed query n-grams for the same level
+                and n_gram (computed here if None)
+            ngram_postings (dict): build_ngram_postings() of ngram_index;
+                scores every field at once with NumPy instead of set
+                intersections per field
             
         Returns:
             list: Ranked results with Jaccard scores
@@ -291,59 +814,137 @@ class FuzzyMatcher:
             ...     threshold=0.3
             ... )
         """
+        scored = []  # (score, document position, best field position)
         results = []
 
-        if level == 'char':
-            query_ngrams = self.character_ngrams(query, n=n_gram)
-        else:
-            query_tokens = self.tokenize(query)
-            query_ngrams = self.word_ngrams(query_tokens, n=n_gram)
+        if query_ngrams is None:
+            if level == 'char':
+                query_ngrams = self.character_ngrams(query, n=n_gram)
+            else:
+                query_tokens = self.tokenize(query)
+                query_ngrams = self.word_ngrams(query_tokens, n=n_gram)
 
-        for doc_idx, doc in enumerate(documents):
+        if ngram_index is None:
+            ngram_index = self.build_ngram_index(documents, fields, level, n_gram)
+
+        if candidate_docs is None:
+            doc_indices = range(len(documents))
+        else:
+            doc_indices = sorted(candidate_docs)
+
+        query_len = len(query_ngrams)
+
+        if ngram_postings is not None and NUMPY_AVAILABLE and ngram_postings['num_fields']:
+            # Intersection sizes of every field from the query n-grams'
+            # posting lists; |A | B| = |A| + |B| - |A & B|
+            sizes = ngram_postings['sizes']
+            postings = ngram_postings['postings']
+            hits = [postings[g] for g in query_ngrams if g in postings]
+            if hits:
+                intersections = np.bincount(np.concatenate(hits), minlength=len(sizes))
+            else:
+                intersections = np.zeros(len(sizes), dtype=np.intp)
+            unions = query_len + sizes - intersections
+
+            # Two empty sets count as identical, as in jaccard_similarity
+            field_scores = np.ones(len(sizes), dtype=np.float64)
+            np.divide(intersections, unions, out=field_scores, where=unions > 0)
+            field_scores = field_scores.reshape(-1, ngram_postings['num_fields'])
+
+            # argmax takes the first best field, like the strict > below
+            best_fields = field_scores.argmax(axis=1)
+            best_scores = field_scores[np.arange(len(field_scores)), best_fields]
+
+            passing = best_scores >= threshold
+            if candidate_docs is not None:
+                in_candidates = np.zeros(len(passing), dtype=bool)
+                in_candidates[doc_indices] = True
+                passing &= in_candidates
+            matched = np.flatnonzero(passing)
+            scored = list(zip(
+                best_scores[matched].tolist(), matched.tolist(), best_fields[matched].tolist()
+            ))
+            doc_indices = ()
+
+        for doc_idx in doc_indices:
             max_jaccard = 0.0
-            common_ngrams = set()
+            best_field = None
 
             # Search in specified fields
-            for field in fields:
-                field_text = str(doc.get(field, ''))
-
-                if level == 'char':
-                    doc_ngrams = self.character_ngrams(field_text, n=n_gram)
-                else:
-                    doc_tokens = self.tokenize(field_text)
-                    doc_ngrams = self.word_ngrams(doc_tokens, n=n_gram)
-
-                jaccard = self.jaccard_similarity(query_ngrams, doc_ngrams)
+            for field_idx, doc_ngrams in enumerate(ngram_index[doc_idx]):
+                doc_len = len(doc_ngrams)
+                if not query_len or not doc_len:
+                    jaccard = self.jaccard_similarity(query_ngrams, doc_ngrams)
+                    if jaccard > max_jaccard:
+                        max_jaccard = jaccard
+                        best_field = field_idx
+                    continue
+
+                # Jaccard <= min(|A|, |B|) / max(|A|, |B|): skip fields that
+                # can neither pass the threshold nor beat the current best
+                bound = min(query_len, doc_len) / max(query_len, doc_len)
+                if bound < threshold or bound <= max_jaccard:
+                    continue
+
+                common = len(query_ngrams & doc_ngrams)
+                jaccard = common / (query_len + doc_len - common)
 
                 if jaccard > max_jaccard:
                     max_jaccard = jaccard
-                    common_ngrams = query_ngrams & doc_ngrams
+                    best_field = field_idx
 
             if max_jaccard >= threshold:
-                result = {
-                    'doc_id': doc.get('doc_id', doc_idx),
-                    'title': doc.get('title', ''),
-                    'url': doc.get('url', ''),
-                    'language': doc.get('language', 'unknown'),
-                    'jaccard_score': max_jaccard,
-                    'common_ngrams': sorted(list(common_ngrams))[:10],  # Top 10
-                    'num_common': len(common_ngrams)
-                }
-
-                if include_snippet:
-                    body = str(doc.get('body', ''))[:200]
-                    result['snippet'] = body + ('...' if len(body) == 200 else '')
-
-                results.append(result)
-
-        # Sort by score descending
-        results.sort(key=lambda x: x['jaccard_score'], reverse=True)
+                scored.append((max_jaccard, doc_idx, best_field))
 
+        # Sort by score descending; result dicts are built only for the
+        # documents that survive the top_k cut. nlargest keeps sort order
+        # (ties by document position) without sorting every match
         if top_k:
-            results = results[:top_k]
+            scored = heapq.nlargest(top_k, scored, key=lambda x: x[0])
+        else:
+            scored.sort(key=lambda x: x[0], reverse=True)
+
+        for max_jaccard, doc_idx, best_field in scored:
+            if best_field is None:
+                common_ngrams = set()
+            else:
+                common_ngrams = query_ngrams & ngram_index[doc_idx][best_field]
+            doc = documents[doc_idx]
+            result = {
+                'doc_id': doc.get('doc_id', doc_idx),
+                'title': doc.get('title', ''),
+                'url': doc.get('url', ''),
+                'language': doc.get('language', 'unknown'),
+                'jaccard_score': max_jaccard,
+                'common_ngrams': heapq.nsmallest(10, common_ngrams),  # Top 10
+                'num_common': len(common_ngrams)
+            }
+
+            if include_snippet:
+                body = str(doc.get('body', ''))[:200]
+                result['snippet'] = body + ('...' if len(body) == 200 else '')
+
+            results.append(result)
 
         return results
 
+    def build_variant_index(self, transliteration_map: Dict[str, List[str]]) -> Dict[str, str]:
+        """
+        Map every transliteration variant back to its original term.
+        
+        Args:
+            transliteration_map (dict): Mapping of terms to transliterations
+            
+        Returns:
+            dict: variant -> original. A variant listed under several terms
+                maps to the first one, as with a scan of the map in order.
+        """
+        variant_index = {}
+        for original, variants in transliteration_map.items():
+            for variant in variants:
+                variant_index.setdefault(variant, original)
+        return variant_index
+
     def search_with_transliteration(
         self,
         query: str,
@@ -351,8 +952,10 @@ class FuzzyMatcher:
         transliteration_map: Dict[str, List[str]],
         fields: List[str] = ['title', 'body'],
         threshold: float = 0.75,
-        top_k: Optional[int] = None
-    ) -> List[Dict]:
+        top_k: Optional[int] = None,
+        token_index: Optional[Dict] = None,
+        variant_index: Optional[Dict[str, str]] = None
+    ) -> List[TransliterationResult]:
         """
         Search using transliteration-aware fuzzy matching.
         
@@ -366,27 +969,35 @@ class FuzzyMatcher:
             fields (list): Document fields to search
             threshold (float): Similarity threshold
             top_k (int): Return top-k results
+            token_index (dict): Prebuilt index from build_token_index()
+            variant_index (dict): Prebuilt index from build_variant_index()
             
         Returns:
-            list: Ranked results combining original and transliterated matches
+            list: Ranked TransliterationResult tuples combining original and
+                transliterated matches
         """
         query_tokens = self.tokenize(query)
         expanded_queries = [set(query_tokens)]  # Start with original
 
+        if variant_index is None:
+            variant_index = self.build_variant_index(transliteration_map)
+
         # Generate transliteration variants
         for token in query_tokens:
             if token in transliteration_map:
                 variants = transliteration_map[token]
                 expanded_queries.append(set([token] + variants))
-            else:
-                # Also check if this token is a transliteration variant
-                for original, variants in transliteration_map.items():
-                    if token in variants:
-                        expanded_queries.append(set([original] + variants))
-                        break
+            elif token in variant_index:
+                # This token is a transliteration variant
+                original = variant_index[token]
+                expanded_queries.append(set([original] + transliteration_map[original]))
 
         results_by_doc = defaultdict(lambda: {'scores': [], 'doc': None})
 
+        # Every variant searches the same documents, so tokenize them once
+        if token_index is None:
+            token_index = self.build_token_index(documents, fields)
+
         # Search with each query variant
         for query_variant in expanded_queries:
             variant_query = ' '.join(query_variant)
@@ -395,7 +1006,8 @@ class FuzzyMatcher:
                 documents,
                 fields=fields,
                 threshold=threshold,
-                include_snippet=False
+                include_snippet=True,
+                token_index=token_index
             )
 
             for result in variant_results:
@@ -406,19 +1018,127 @@ class FuzzyMatcher:
         # Combine scores
         final_results = []
         for doc_id, data in results_by_doc.items():
-            avg_score = sum(data['scores']) / len(data['scores'])
-            result = data['doc'].copy()
-            result['fuzzy_score'] = avg_score
-            result['variant_matches'] = len(data['scores'])
-            final_results.append(result)
-
-        final_results.sort(key=lambda x: x['fuzzy_score'], reverse=True)
+            doc = data['doc']
+            final_results.append(TransliterationResult(
+                doc_id=doc_id,
+                title=doc['title'],
+                url=doc['url'],
+                language=doc['language'],
+                fuzzy_score=sum(data['scores']) / len(data['scores']),
+                variant_matches=len(data['scores']),
+                snippet=doc.get('snippet', '')
+            ))
 
         if top_k:
-            final_results = final_results[:top_k]
+            final_results = heapq.nlargest(top_k, final_results, key=lambda x: x.fuzzy_score)
+        else:
+            final_results.sort(key=lambda x: x.fuzzy_score, reverse=True)
 
         return final_results
 
+    def build_ngram_index(
+        self,
+        documents: List[Dict],
+        fields: List[str] = ['title', 'body'],
+        level: str = 'char',
+        n_gram: int = 3
+    ) -> List[List[FrozenSet[str]]]:
+        """
+        Pre-compute n-gram sets for every document field.
+
+        Unlike batch_compute_ngrams, fields are kept separate (Jaccard
+        search scores each field on its own) and the matcher's text cache
+        is bypassed so the index is the only copy.
+        
+        Args:
+            documents (list): Document list
+            fields (list): Document fields to process
+            level (str): 'char' or 'word'
+            n_gram (int): N-gram size
+            
+        Returns:
+            list: Per document (in order), one frozenset of n-grams per field
+        """
+        ngram_index = []
+
+        for doc in documents:
+            doc_ngrams = []
+
+            for field in fields:
+                field_text = str(doc.get(field, ''))
+
+                if level == 'char':
+                    text = field_text.lower().replace(' ', '')
+                    ngrams = frozenset(text[i:i + n_gram] for i in range(len(text) - n_gram + 1))
+                else:
+                    ngrams = frozenset(self.word_ngrams(self.tokenize(field_text), n=n_gram))
+
+                doc_ngrams.append(ngrams)
+
+            ngram_index.append(doc_ngrams)
+
+        return ngram_index
+
+    def build_ngram_postings(self, ngram_index: List[List[FrozenSet[str]]]) -> Dict:
+        """
+        Invert an n-gram index for vectorized Jaccard search (requires NumPy).
+
+        Every (document, field) pair gets a slot, document position times
+        the number of fields plus field position.
+
+        Args:
+            ngram_index (list): Index from build_ngram_index()
+
+        Returns:
+            dict: 'postings' (n-gram -> array of slots containing it),
+                'sizes' (n-gram count of every slot) and 'num_fields'
+        """
+        ngram_postings = {
+            'postings': {},
+            'sizes': np.empty(0, dtype=np.intp),
+            'num_fields': 0
+        }
+        self.extend_ngram_postings(ngram_postings, ngram_index)
+        return ngram_postings
+
+    def extend_ngram_postings(
+        self,
+        ngram_postings: Dict,
+        ngram_index: List[List[FrozenSet[str]]]
+    ) -> None:
+        """
+        Append documents to postings from build_ngram_postings() in place.
+
+        Args:
+            ngram_postings (dict): Postings to extend
+            ngram_index (list): build_ngram_index() output for the new
+                documents only, in order
+        """
+        if ngram_index and not ngram_postings['num_fields']:
+            ngram_postings['num_fields'] = len(ngram_index[0])
+
+        first_slot = len(ngram_postings['sizes'])
+        new_postings = defaultdict(list)
+        sizes = []
+
+        for doc_ngrams in ngram_index:
+            for ngrams in doc_ngrams:
+                slot = first_slot + len(sizes)
+                sizes.append(len(ngrams))
+                for ngram in ngrams:
+                    new_postings[ngram].append(slot)
+
+        postings = ngram_postings['postings']
+        for ngram, slots in new_postings.items():
+            slots = np.array(slots, dtype=np.intp)
+            if ngram in postings:
+                slots = np.concatenate([postings[ngram], slots])
+            postings[ngram] = slots
+
+        ngram_postings['sizes'] = np.concatenate([
+            ngram_postings['sizes'], np.array(sizes, dtype=np.intp)
+        ])
+
     def batch_compute_ngrams(
         self,
         documents: List[Dict],
@@ -13,7 +13,7 @@ import json
 import time
 from typing import List, Dict
 from fuzzy_matcher import FuzzyMatcher
-from clir_search import CLIRSearch
+from clir_search import CLIRSearch, DATASKETCH_AVAILABLE
 
 
 # ============================================================================
@@ -256,8 +256,8 @@ def test_transliteration_search():
     if results:
         print(f"✓ Found {len(results)} results")
         for i, result in enumerate(results, 1):
-            print(f"{i}. {result['title']} (Score: {result['fuzzy_score']:.3f})")
-            print(f"   Language: {result['language']}")
+            print(f"{i}. {result.title} (Score: {result.fuzzy_score:.3f})")
+            print(f"   Language: {result.language}")
     else:
         print("✗ No results found")
 
@@ -287,6 +287,77 @@ def test_hybrid_search():
         print(f"   Breakdown: {result['scores_breakdown']}")
 
 
+def test_add_documents():
+    """Test adding documents to an existing index."""
+    print("\n" + "="*80)
+    print("TEST 9: Adding Documents")
+    print("="*80)
+
+    half = len(SAMPLE_DOCUMENTS) // 2
+    clir = CLIRSearch(documents=list(SAMPLE_DOCUMENTS[:half]))
+    clir.add_documents(SAMPLE_DOCUMENTS[half:])
+    full = CLIRSearch(documents=list(SAMPLE_DOCUMENTS))
+
+    for query in ['Bangaldesh econmy', 'ঢাকা']:
+        same = (
+            clir.search_edit_distance(query, threshold=0.7) == full.search_edit_distance(query, threshold=0.7)
+            and clir.search_jaccard(query, threshold=0.1) == full.search_jaccard(query, threshold=0.1)
+        )
+        print(f"Query: '{query}'")
+        print("✓ Same results as a full rebuild" if same else "✗ Results differ from a full rebuild")
+        assert same
+
+    # The MinHash LSH index is extended in place rather than rebuilt
+    if not DATASKETCH_AVAILABLE:
+        print("datasketch not installed, skipping the LSH check")
+        return
+    clir = CLIRSearch(documents=list(SAMPLE_DOCUMENTS[:half]), lsh_threshold=0.2)
+    lsh = clir._get_minhash_index(['title', 'body'])
+    clir.add_documents(SAMPLE_DOCUMENTS[half:])
+    full = CLIRSearch(documents=list(SAMPLE_DOCUMENTS), lsh_threshold=0.2)
+
+    for query in ['Bangladesh economy', 'ঢাকায় আবহাওয়া']:
+        results = clir.search_jaccard(query, threshold=0.2)
+        same = results == full.search_jaccard(query, threshold=0.2)
+        print(f"Query (LSH): '{query}'")
+        print("✓ Same results as a full rebuild" if same else "✗ Results differ from a full rebuild")
+        assert results and same
+    assert clir._get_minhash_index(['title', 'body']) is lsh
+
+
+def test_failed_bm25_rebuild():
+    """Test that a failed deferred BM25 rebuild drops the stale retriever."""
+    print("\n" + "="*80)
+    print("TEST 10: Failed BM25 Rebuild")
+    print("="*80)
+
+    import clir_search
+
+    class StaleRetriever:
+        def search(self, query, top_k, language):
+            return [{'doc_id': 0, 'bm25_score': 1.0}]
+
+    class FailingRetriever:
+        def __init__(self, documents, language):
+            raise RuntimeError("rebuild failed")
+
+    clir = CLIRSearch(documents=list(SAMPLE_DOCUMENTS[:2]))
+    clir.bm25_retriever = StaleRetriever()
+    clir.add_documents(SAMPLE_DOCUMENTS[2:])
+
+    saved = (clir_search.BM25_AVAILABLE, getattr(clir_search, 'BM25Retriever', None))
+    clir_search.BM25_AVAILABLE, clir_search.BM25Retriever = True, FailingRetriever
+    try:
+        results = clir.search_bm25('Bangladesh')
+        results_again = clir.search_bm25('Bangladesh')
+    finally:
+        clir_search.BM25_AVAILABLE, clir_search.BM25Retriever = saved
+
+    dropped = results == [] and results_again == [] and clir.bm25_retriever is None and not clir._bm25_stale
+    print("✓ Stale retriever dropped, no retry" if dropped else "✗ Stale retriever still in use")
+    assert dropped
+
+
 # ============================================================================
 # SPECIAL TEST CASES - Real-World Scenarios
 # ============================================================================
@@ -338,8 +409,8 @@ def test_case_cross_script():
         if results:
             print(f"✓ Found {len(results)} cross-script matches:")
             for r in results:
-                lang = r.get('language', 'unknown')
-                print(f"  - {r['title']} ({lang})")
+                lang = r.language or 'unknown'
+                print(f"  - {r.title} ({lang})")
         else:
             print("✗ No matches found")
 
@@ -472,6 +543,8 @@ def run_all_tests():
     test_jaccard_search()
     test_transliteration_search()
     test_hybrid_search()
+    test_add_documents()
+    test_failed_bm25_rebuild()
 
     # Special test cases
     test_case_typo_handling()
@@ -148,9 +148,9 @@ def main():
     results = clir.search_transliteration('Dhaka', threshold=0.5, top_k=5)
     
     for i, result in enumerate(results, 1):
-        lang = result.get('language', 'unknown')
-        score = result.get('fuzzy_score', 0)
-        title = result['title']
+        lang = result.language or 'unknown'
+        score = result.fuzzy_score
+        title = result.title
         if len(title) > 60:
             title = title[:57] + "..."
         
@@ -100,7 +100,7 @@ def test_with_sample():
         print(f"Query: '{query}' ({desc})")
         print(f"Time: {search_time*1000:.1f}ms | Results: {len(results)}")
         if results:
-            print(f"  Top result: {results[0]['title'][:60]}...")
+            print(f"  Top result: {results[0].title[:60]}...")
         print()
 
 # ============================================================================
@@ -244,9 +244,9 @@ def test_cross_lingual():
         bn_lang_dist = defaultdict(int)
         
         for r in en_results:
-            en_lang_dist[r.get('language', 'unknown')] += 1
+            en_lang_dist[r.language or 'unknown'] += 1
         for r in bn_results:
-            bn_lang_dist[r.get('language', 'unknown')] += 1
+            bn_lang_dist[r.language or 'unknown'] += 1
         
         print(f"\n'{en_term}' ({en_time*1000:.1f}ms)")
         print(f"  Finds: {dict(en_lang_dist)} documents")
@@ -192,26 +192,28 @@ def main():
         # Load documents from database
         import sqlite3
         conn = sqlite3.connect(str(db_path))
-        cursor = conn.cursor()
+        conn.execute("PRAGMA cache_size=-20000")
         
         # Note: Database uses 'id' not 'doc_id'
-        cursor.execute("""
-            SELECT id, title, body, source, language 
+        # Body is truncated in SQLite so the full text never crosses into Python
+        cursor = conn.execute("""
+            SELECT id, title, substr(body, 1, 2000), source, language 
             FROM articles 
             LIMIT 5000
         """)
         
-        rows = cursor.fetchall()
-        documents = []
-        for row in rows:
-            doc_id, title, body, source, language = row
-            documents.append({
-                'doc_id': doc_id,
-                'title': title or '',
-                'body': body or '',
-                'source': source or '',
-                'language': language or 'en'
-            })
+        # Iterate the cursor directly so rows stream in instead of being
+        # materialized twice (once by fetchall, once in documents)
+        documents = [
+            {
+                'doc_id': r[0],
+                'title': r[1] or '',
+                'body': r[2] or '',
+                'source': r[3] or '',
+                'language': r[4] or 'en'
+            }
+            for r in cursor
+        ]
         
         conn.close()
         
@@ -267,17 +269,17 @@ def main():
                 print(f"✓ Found {len(results)} results in {search_time*1000:.2f}ms\n")
                 
                 for rank, result in enumerate(results, 1):
-                    title = result['title']
+                    title = result.title
                     if len(title) > 60:
                         title = title[:57] + "..."
                     
-                    score = result['fuzzy_score']
-                    language = result.get('language', 'unknown')
+                    score = result.fuzzy_score
+                    language = result.language or 'unknown'
                     
                     print(f"  {rank}. {title}")
                     print(f"     Language: {language} | Score: {score:.4f}")
-                    if 'snippet' in result:
-                        snippet = result['snippet'][:80].replace('\n', ' ')
+                    if result.snippet:
+                        snippet = result.snippet[:80].replace('\n', ' ')
                         print(f"     Snippet: {snippet}...")
                     print()
                 
@@ -80,7 +80,7 @@ def example_cross_script_matching():
     
     print("Cross-script results for 'Dhaka weather':")
     for result in results:
-        print(f"  {result['title']} ({result['language']})")
+        print(f"  {result.title} ({result.language})")
 
 
 # ============================================================================
@@ -132,7 +132,7 @@ def example_hybrid_search():
 def example_performance_comparison():
     """Compare different search methods."""
     from fuzzy_matching import CLIRSearch
-    import time
+    import timeit
     
     documents = [
         {
@@ -148,20 +148,18 @@ def example_performance_comparison():
     
     query = "Bangladesh"
     
-    # Time edit distance search
-    start = time.time()
     edit_results = clir.search_edit_distance(query)
-    edit_time = time.time() - start
-    
-    # Time Jaccard search
-    start = time.time()
     jaccard_results = clir.search_jaccard(query)
-    jaccard_time = time.time() - start
-    
-    # Time hybrid search
-    start = time.time()
     hybrid_results, timing = clir.hybrid_search(query)
-    hybrid_time = time.time() - start
+    
+    # Best of 5 runs per method; repeats reuse CLIRSearch's query caches,
+    # so these are warm-query latencies
+    def best_time(search):
+        return min(timeit.repeat(search, number=1, repeat=5))
+    
+    edit_time = best_time(lambda: clir.search_edit_distance(query))
+    jaccard_time = best_time(lambda: clir.search_jaccard(query))
+    hybrid_time = best_time(lambda: clir.hybrid_search(query))
     
     print("Performance Comparison:")
     print(f"  Edit Distance:  {len(edit_results)} results in {edit_time*1000:.2f}ms")
@@ -243,7 +241,8 @@ def example_threshold_tuning():
     
     clir = CLIRSearch(documents=documents)
     
-    # Test different thresholds
+    # Test different thresholds; in ascending order the scores computed
+    # for the first threshold are reused by the rest
     thresholds = [0.5, 0.6, 0.7, 0.75, 0.8, 0.85, 0.9]
     query = "Bangaldesh"
     
@@ -297,8 +296,8 @@ def example_dynamic_updates():
         }
     ]
     
-    # Reinitialize with updated documents
-    clir.documents.extend(new_documents)
+    # Index only the new documents; existing indexes are kept
+    clir.add_documents(new_documents)
     
     # Search will now include new documents
     results = clir.search_edit_distance("Bangladesh")
@@ -413,15 +412,29 @@ def example_comprehensive_transliteration_map():
 def example_production_setup():
     """Complete production-ready setup."""
     from fuzzy_matching import CLIRSearch
+    from pathlib import Path
     import json
+
+    # orjson parses bytes directly and is much faster on large files
+    try:
+        import orjson
+    except ImportError:
+        orjson = None
+
+    def load_json(path):
+        data = Path(path).read_bytes()
+        return orjson.loads(data) if orjson else json.loads(data)
+
+    def dump_json(obj):
+        if orjson:
+            return orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS).decode('utf-8')
+        return json.dumps(obj, indent=2, ensure_ascii=False)
     
     # Load documents from database or file
-    with open('documents.json', 'r') as f:
-        documents = json.load(f)
+    documents = load_json('documents.json')
     
     # Load transliteration map
-    with open('transliteration_map.json', 'r') as f:
-        trans_map = json.load(f)
+    trans_map = load_json('transliteration_map.json')
     
     # Initialize with production parameters
     clir = CLIRSearch(
@@ -457,7 +470,7 @@ def example_production_setup():
         }
         
         # Return or save response
-        print(json.dumps(response, indent=2, ensure_ascii=False))
+        print(dump_json(response))
         
     except Exception as e:
         response = {
@@ -465,7 +478,7 @@ def example_production_setup():
             'query': query,
             'error': str(e)
         }
-        print(json.dumps(response, indent=2))
+        print(dump_json(response))
 
 
 # ============================================================================
@@ -9,7 +9,7 @@ import time
 from pathlib import Path
 
 # Handle Unicode output on Windows
-if sys.platform == 'win32':
+if sys.platform == 'win32' and (sys.stdout.encoding or '').lower() not in ('utf-8', 'utf8'):
     sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8', errors='replace')
 
 from fuzzy_matcher import FuzzyMatcher
@@ -82,28 +82,33 @@ def test_database_search():
     # Load only a sample for faster testing
     import sqlite3
     conn = sqlite3.connect(str(DB_PATH))
-    cursor = conn.cursor()
-    cursor.execute("SELECT id, title, body, url, date, language, tokens FROM articles LIMIT 500")
-    rows = cursor.fetchall()
+    # NULL handling and body truncation happen in SQLite so long bodies
+    # are never copied into Python
+    rows = conn.execute("""
+        SELECT id, coalesce(title, ''), substr(coalesce(body, ''), 1, 500),
+               coalesce(url, ''), coalesce(date, ''),
+               coalesce(nullif(language, ''), 'en'), tokens
+        FROM articles LIMIT 500
+    """).fetchall()
     conn.close()
 
-    documents = []
-    for row in rows:
-        doc_id, title, body, url, date, language, tokens = row
-        documents.append({
+    documents = [
+        {
             'doc_id': doc_id,
-            'title': title or '',
-            'body': (body or '')[:500],  # Limit body for speed
-            'url': url or '',
-            'date': date or '',
-            'language': language or 'en',
+            'title': title,
+            'body': body,
+            'url': url,
+            'date': date,
+            'language': language,
             'token_count': tokens
-        })
+        }
+        for doc_id, title, body, url, date, language, tokens in rows
+    ]
 
     try:
-        start = time.time()
+        start = time.perf_counter()
         clir = CLIRSearch(documents=documents, transliteration_map=TRANSLITERATION_MAP)
-        load_time = time.time() - start
+        load_time = time.perf_counter() - start
         print(f"[OK] Loaded {len(clir.documents)} documents in {load_time:.2f}s")
     except Exception as e:
         print(f"[ERROR] Failed to initialize: {e}")
@@ -112,9 +117,9 @@ def test_database_search():
     # Test Edit Distance Search
     print("\n[Edit Distance Search]")
     query = "Bangaldesh econmy"  # typos
-    start = time.time()
+    start = time.perf_counter()
     results = clir.search_edit_distance(query, threshold=0.75, top_k=3)
-    search_time = time.time() - start
+    search_time = time.perf_counter() - start
 
     print(f"  Query: '{query}'")
     print(f"  Time: {search_time*1000:.1f}ms | Results: {len(results)}")
@@ -126,9 +131,9 @@ def test_database_search():
     # Test Jaccard Search
     print("\n[Jaccard Search]")
     query = "climate change"
-    start = time.time()
+    start = time.perf_counter()
     results = clir.search_jaccard(query, level='char', n_gram=3, threshold=0.15, top_k=3)
-    search_time = time.time() - start
+    search_time = time.perf_counter() - start
 
     print(f"  Query: '{query}'")
     print(f"  Time: {search_time*1000:.1f}ms | Results: {len(results)}")
@@ -138,9 +143,9 @@ def test_database_search():
     # Test Bangla Search
     print("\n[Bangla Search]")
     query = "করোনা"  # Corona in Bangla
-    start = time.time()
+    start = time.perf_counter()
     results = clir.search_edit_distance(query, threshold=0.7, top_k=3)
-    search_time = time.time() - start
+    search_time = time.perf_counter() - start
 
     print(f"  Query: '{query}'")
     print(f"  Time: {search_time*1000:.1f}ms | Results: {len(results)}")
@@ -164,23 +169,28 @@ def test_hybrid_search():
     # Load smaller sample for hybrid test
     import sqlite3
     conn = sqlite3.connect(str(DB_PATH))
-    cursor = conn.cursor()
-    cursor.execute("SELECT id, title, body, url, date, language, tokens FROM articles LIMIT 200")
-    rows = cursor.fetchall()
+    # NULL handling and body truncation happen in SQLite so long bodies
+    # are never copied into Python
+    rows = conn.execute("""
+        SELECT id, coalesce(title, ''), substr(coalesce(body, ''), 1, 300),
+               coalesce(url, ''), coalesce(date, ''),
+               coalesce(nullif(language, ''), 'en'), tokens
+        FROM articles LIMIT 200
+    """).fetchall()
     conn.close()
 
-    documents = []
-    for row in rows:
-        doc_id, title, body, url, date, language, tokens = row
-        documents.append({
+    documents = [
+        {
             'doc_id': doc_id,
-            'title': title or '',
-            'body': (body or '')[:300],
-            'url': url or '',
-            'date': date or '',
-            'language': language or 'en',
+            'title': title,
+            'body': body,
+            'url': url,
+            'date': date,
+            'language': language,
             'token_count': tokens
-        })
+        }
+        for doc_id, title, body, url, date, language, tokens in rows
+    ]
 
     clir = CLIRSearch(documents=documents, transliteration_map=TRANSLITERATION_MAP)
 
@@ -189,14 +199,14 @@ def test_hybrid_search():
     print("Weights: BM25=0.5 (unavailable), Edit=0.25, Jaccard=0.25")
     print("Note: BM25 not available, using fuzzy methods only")
 
-    start = time.time()
+    start = time.perf_counter()
     results, timing = clir.hybrid_search(
         query,
         weights={'bm25': 0.0, 'edit': 0.5, 'jaccard': 0.5},  # No BM25
         top_k=5,
         verbose=False
     )
-    total_time = time.time() - start
+    total_time = time.perf_counter() - start
 
     print(f"\nTotal time: {total_time*1000:.1f}ms")
     print(f"Results: {len(results)}")
@@ -16,10 +16,14 @@ Usage:
 
 import re
 import csv
+import hashlib
+import importlib.util
 import unicodedata
 from dataclasses import dataclass, field
+from functools import lru_cache
+from itertools import islice
 from pathlib import Path
-from typing import Dict, List, Optional, Set, Tuple
+from typing import Dict, List, Optional, Tuple
 
 # Try to import translation libraries
 try:
@@ -38,25 +42,41 @@ TRANSLATOR_AVAILABLE = HAS_DEEP_TRANSLATOR or HAS_GOOGLETRANS
 if not TRANSLATOR_AVAILABLE:
     print("Warning: No translation library installed. Translation will be disabled.")
 
-# Try to import NLTK WordNet for English synonyms
-try:
-    from nltk.corpus import wordnet
-    WORDNET_AVAILABLE = True
-except ImportError:
-    WORDNET_AVAILABLE = False
+# Check for NLTK WordNet (English synonyms) without importing it: nltk
+# takes most of a second to import and is only needed for query expansion
+WORDNET_AVAILABLE = importlib.util.find_spec('nltk') is not None
+if not WORDNET_AVAILABLE:
     print("Warning: NLTK WordNet not available. Using fallback English synonyms.")
 
-# Try to import transformers for NER
+# Check for transformers (NER) without importing it: the import takes
+# seconds and is only needed once an NER model is first loaded
+TRANSFORMERS_AVAILABLE = importlib.util.find_spec('transformers') is not None
+if not TRANSFORMERS_AVAILABLE:
+    print("Warning: transformers not installed. Using fallback NE mapping.")
+
+# Try to import joblib for batch processing
 try:
-    from transformers import pipeline
-    TRANSFORMERS_AVAILABLE = True
+    from joblib import Parallel, delayed
+    JOBLIB_AVAILABLE = True
 except ImportError:
-    TRANSFORMERS_AVAILABLE = False
-    print("Warning: transformers not installed. Using fallback NE mapping.")
+    JOBLIB_AVAILABLE = False
 
+# Token patterns used by QueryProcessor.normalize, compiled once
+_BANGLA_TOKEN_PATTERN = re.compile(r'[\u0980-\u09FF]+')
+_ENGLISH_TOKEN_PATTERN = re.compile(r'[a-zA-Z0-9]+')
 
+
+@lru_cache(maxsize=None)
+def _load_ner_pipeline(model: str, tokenizer: Optional[str] = None):
+    """Build an NER pipeline once per process, shared by all QueryProcessors."""
+    from transformers import pipeline
+
+    return pipeline("ner", model=model, tokenizer=tokenizer, aggregation_strategy="simple")
+
+
+@lru_cache(maxsize=None)
 def load_bangla_synonyms_from_csv() -> Dict[str, List[str]]:
-    """Load Bangla synonyms from the cleaned CSV file."""
+    """Load Bangla synonyms from the cleaned CSV file, once, on first use."""
     csv_path = Path(__file__).parent / "bangla_synonyms_cleaned.csv"
     synonyms_dict = {}
 
@@ -77,10 +97,6 @@ def load_bangla_synonyms_from_csv() -> Dict[str, List[str]]:
     return synonyms_dict
 
 
-# Load Bangla synonyms from CSV at module load time
-BANGLA_SYNONYMS_CSV = load_bangla_synonyms_from_csv()
-
-
 @dataclass
 class ProcessedQuery:
     """Container for processed query results."""
@@ -110,6 +126,15 @@ class QueryProcessor:
     # Bangla Unicode range
     BANGLA_RANGE = (0x0980, 0x09FF)
 
+    # Max number of distinct texts whose detected language is memoized
+    LANGUAGE_CACHE_SIZE = 4096
+
+    # Max number of distinct (text, language, stopword setting) normalizations memoized
+    NORMALIZE_CACHE_SIZE = 4096
+
+    # Max number of distinct English words whose WordNet lemmas are memoized
+    SYNONYM_CACHE_SIZE = 16384
+
     # English stopwords (common words to optionally remove)
     ENGLISH_STOPWORDS = {
         'a', 'an', 'the', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for',
@@ -258,6 +283,10 @@ class QueryProcessor:
         'ফুটবল': 'Football',
     }
 
+    # Lowercased English -> Bangla view of the fallback map, built once for
+    # all instances rather than in every __init__
+    _NE_MAP_EN_TO_BN = {v.lower(): k for k, v in NAMED_ENTITY_MAP_FALLBACK.items()}
+
     # Bangla NER label mapping (from mbert-bengali-ner model)
     BANGLA_LABEL_MAP = {
         'LABEL_1': 'PER',  # Person (first part)
@@ -308,13 +337,25 @@ class QueryProcessor:
         self._translation_cache = {} if use_translation_cache else None
 
         # Build reverse NE map for fallback (English -> Bangla)
-        self.ne_map_en_to_bn = {v.lower(): k for k, v in self.NAMED_ENTITY_MAP_FALLBACK.items()}
-        self.ne_map_bn_to_en = {k: v for k, v in self.NAMED_ENTITY_MAP_FALLBACK.items()}
+        self.ne_map_en_to_bn = dict(self._NE_MAP_EN_TO_BN)
+        self.ne_map_bn_to_en = dict(self.NAMED_ENTITY_MAP_FALLBACK)
 
         # Lazy-loaded NER models (initialized on first use)
         self._english_ner = None
         self._bangla_ner = None
 
+        # Repeated queries (and process_for_search, which detects the same
+        # query several times) skip the character scan
+        self._detect_language_cached = lru_cache(maxsize=self.LANGUAGE_CACHE_SIZE)(self._detect_language)
+
+        # process_for_search normalizes every query twice, and clean or
+        # repeated queries need no work beyond a lookup
+        self._normalize_cached = lru_cache(maxsize=self.NORMALIZE_CACHE_SIZE)(self._normalize)
+
+        # Query vocabulary repeats a lot, and each WordNet lookup walks the
+        # corpus, so lemma names are looked up once per distinct word
+        self._wordnet_lemmas_cached = lru_cache(maxsize=self.SYNONYM_CACHE_SIZE)(self._wordnet_lemmas)
+
     def _initialize_translation_backend(self, backend: str):
         """Initialize the translation backend."""
         if backend == 'auto':
@@ -348,11 +389,9 @@ class QueryProcessor:
         """Lazy load English NER model."""
         if self._english_ner is None and TRANSFORMERS_AVAILABLE:
             try:
-                self._english_ner = pipeline(
-                    "ner",
+                self._english_ner = _load_ner_pipeline(
                     model="xlm-roberta-large-finetuned-conll03-english",
                     tokenizer="xlm-roberta-large-finetuned-conll03-english",
-                    aggregation_strategy="simple"
                 )
             except Exception as e:
                 print(f"Warning: Failed to load English NER model: {e}")
@@ -363,11 +402,7 @@ class QueryProcessor:
         """Lazy load Bangla NER model."""
         if self._bangla_ner is None and TRANSFORMERS_AVAILABLE:
             try:
-                self._bangla_ner = pipeline(
-                    "ner",
-                    model="sagorsarker/mbert-bengali-ner",
-                    aggregation_strategy="simple"
-                )
+                self._bangla_ner = _load_ner_pipeline(model="sagorsarker/mbert-bengali-ner")
             except Exception as e:
                 print(f"Warning: Failed to load Bangla NER model: {e}")
                 self._bangla_ner = False  # Mark as failed
@@ -383,17 +418,24 @@ class QueryProcessor:
         Returns:
             'bn' for Bangla, 'en' for English
         """
-        if not text:
+        return self._detect_language_cached(text)
+
+    def _detect_language(self, text: str) -> str:
+        """Uncached body of detect_language."""
+        # Pure-ASCII text (empty included) cannot contain Bangla characters
+        if text.isascii():
             return 'en'
 
         bangla_count = 0
         total_alpha = 0
+        # Range bounds as one-character strings bound to locals, so the loop
+        # does no attribute lookups or ord() calls
+        bangla_low, bangla_high = map(chr, self.BANGLA_RANGE)
 
         for char in text:
             if char.isalpha():
                 total_alpha += 1
-                code_point = ord(char)
-                if self.BANGLA_RANGE[0] <= code_point <= self.BANGLA_RANGE[1]:
+                if bangla_low <= char <= bangla_high:
                     bangla_count += 1
 
         if total_alpha == 0:
@@ -410,9 +452,8 @@ class QueryProcessor:
         Steps:
         1. Unicode normalization (NFC)
         2. Lowercase
-        3. Remove extra whitespace
-        4. Tokenize
-        5. Optional stopword removal
+        3. Tokenize (drops all whitespace; tokens are rejoined with single spaces)
+        4. Optional stopword removal
 
         Args:
             text: Input text
@@ -421,34 +462,40 @@ class QueryProcessor:
         Returns:
             Tuple of (normalized_text, tokens)
         """
-        # Unicode normalization
-        text = unicodedata.normalize('NFC', text)
+        normalized_text, tokens = self._normalize_cached(text, language, self.remove_stopwords)
+        # Fresh list per call, so callers may modify it without touching the cache
+        return normalized_text, list(tokens)
+
+    def _normalize(self, text: str, language: str, remove_stopwords: bool) -> Tuple[str, Tuple[str, ...]]:
+        """Uncached body of normalize; takes remove_stopwords so toggling it misses the cache."""
+        # Unicode normalization (ASCII text is already NFC)
+        if not text.isascii():
+            text = unicodedata.normalize('NFC', text)
 
         # Lowercase
         text = text.lower()
 
-        # Remove extra whitespace
-        text = ' '.join(text.split())
+        # No separate whitespace collapse: whitespace never matches a token
+        # pattern, and normalized_text is rebuilt from the tokens
 
         # Tokenize based on language
         if language == 'bn':
             # Bangla tokenization - split on whitespace and punctuation
-            tokens = re.findall(r'[\u0980-\u09FF]+', text)
+            tokens = _BANGLA_TOKEN_PATTERN.findall(text)
         else:
             # English tokenization
-            tokens = re.findall(r'[a-zA-Z0-9]+', text)
+            tokens = _ENGLISH_TOKEN_PATTERN.findall(text)
 
         # Optional stopword removal
-        if self.remove_stopwords:
+        if remove_stopwords:
             stopwords = self.BANGLA_STOPWORDS if language == 'bn' else self.ENGLISH_STOPWORDS
             tokens = [t for t in tokens if t not in stopwords]
 
         normalized_text = ' '.join(tokens)
-        return normalized_text, tokens
+        return normalized_text, tuple(tokens)
 
     def _get_translation_cache_key(self, text: str, source_lang: str, target_lang: str) -> str:
         """Generate cache key for translation."""
-        import hashlib
         key_string = f"{text}|{source_lang}|{target_lang}"
         return hashlib.md5(key_string.encode('utf-8')).hexdigest()
 
@@ -522,16 +569,18 @@ class QueryProcessor:
             return []
 
         expanded = []
-        tokens_lower = [t.lower() for t in tokens]
+        # Only used for membership tests, against every candidate synonym
+        tokens_lower = {t.lower() for t in tokens}
 
         if language == 'bn':
             # Use Bangla synonyms: first check CSV, then fallback dictionary
+            bangla_synonyms_csv = load_bangla_synonyms_from_csv()
             for token in tokens:
                 synonyms_found = []
 
                 # First check CSV-loaded synonyms (primary source)
-                if token in BANGLA_SYNONYMS_CSV:
-                    synonyms_found.extend(BANGLA_SYNONYMS_CSV[token])
+                if token in bangla_synonyms_csv:
+                    synonyms_found.extend(bangla_synonyms_csv[token])
 
                 # Then check fallback dictionary for domain-specific terms
                 if token in self.BANGLA_SYNONYMS:
@@ -548,18 +597,16 @@ class QueryProcessor:
             if WORDNET_AVAILABLE:
                 for token in tokens:
                     token_lower = token.lower()
-                    synonyms_found = set()
-
-                    # Get all synsets for the word
-                    for syn in wordnet.synsets(token_lower):
-                        for lemma in syn.lemmas():
-                            lemma_name = lemma.name().lower().replace('_', ' ')
-                            # Only add if different from original and not already in query
-                            if lemma_name != token_lower and lemma_name not in tokens_lower:
-                                synonyms_found.add(lemma_name)
-
-                    # Add top synonyms
-                    for synonym in list(synonyms_found)[:max_synonyms]:
+
+                    # Lemma names in synset order (most common senses first),
+                    # only if different from original and not already in query
+                    synonyms_found = (
+                        lemma_name for lemma_name in self._wordnet_lemmas_cached(token_lower)
+                        if lemma_name != token_lower and lemma_name not in tokens_lower
+                    )
+
+                    # Add top synonyms, stopping once enough are found
+                    for synonym in islice(synonyms_found, max_synonyms):
                         if synonym not in expanded:
                             expanded.append(synonym)
             else:
@@ -573,6 +620,16 @@ class QueryProcessor:
 
         return expanded
 
+    def _wordnet_lemmas(self, word: str) -> Tuple[str, ...]:
+        """Distinct lemma names (lowercase, spaces for underscores) of all WordNet synsets of word, in synset order."""
+        from nltk.corpus import wordnet
+
+        return tuple(dict.fromkeys(
+            lemma.name().lower().replace('_', ' ')
+            for syn in wordnet.synsets(word)
+            for lemma in syn.lemmas()
+        ))
+
     def extract_named_entities(self, text: str, language: str) -> List[Dict]:
         """
         Extract named entities from text using ML models.
@@ -689,6 +746,7 @@ class QueryProcessor:
         query: str,
         target_lang: Optional[str] = None,
         expand: Optional[bool] = None,
+        detected_lang: Optional[str] = None,
     ) -> ProcessedQuery:
         """
         Process query through the complete pipeline.
@@ -704,6 +762,7 @@ class QueryProcessor:
             query: Raw query text
             target_lang: Target language for translation (None = no translation)
             expand: Override expansion setting (None = use default)
+            detected_lang: Language already detected for this query (None = detect it)
 
         Returns:
             ProcessedQuery object with all processing results
@@ -711,7 +770,8 @@ class QueryProcessor:
         steps = []
 
         # Step 1: Language Detection
-        detected_lang = self.detect_language(query)
+        if detected_lang is None:
+            detected_lang = self.detect_language(query)
         steps.append(f"Language detected: {detected_lang}")
 
         # Step 2: Normalization
@@ -777,23 +837,65 @@ class QueryProcessor:
         """
         # Process original query
         detected_lang = self.detect_language(query)
-        original_processed = self.process(query)
+        original_processed = self.process(query, detected_lang=detected_lang)
 
         result = {'original': original_processed}
 
         if search_both_languages:
             # Translate to the other language
             target_lang = 'bn' if detected_lang == 'en' else 'en'
-            translated_processed = self.process(query, target_lang=target_lang)
+            translated_processed = self.process(query, target_lang=target_lang, detected_lang=detected_lang)
             result['translated'] = translated_processed
 
         return result
 
+    def process_batch(
+        self,
+        queries: List[str],
+        target_lang: Optional[str] = None,
+        expand: Optional[bool] = None,
+        n_jobs: int = -1,
+    ) -> List[ProcessedQuery]:
+        """
+        Process several queries, in parallel when joblib is available.
+
+        Uses threads: most of the time per query is spent waiting on the
+        translation service, and the caches stay shared.
+
+        Args:
+            queries: Raw query texts
+            target_lang: Target language for translation (None = no translation)
+            expand: Override expansion setting (None = use default)
+            n_jobs: Number of threads (-1 = all cores, 1 = sequential)
+
+        Returns:
+            List of ProcessedQuery objects in the same order as queries
+        """
+        if not JOBLIB_AVAILABLE or n_jobs == 1 or len(queries) < 2:
+            return [self.process(query, target_lang=target_lang, expand=expand) for query in queries]
+
+        return Parallel(n_jobs=n_jobs, prefer='threads')(
+            delayed(self.process)(query, target_lang=target_lang, expand=expand)
+            for query in queries
+        )
+
     def clear_translation_cache(self):
         """Clear the translation cache."""
         if self._translation_cache is not None:
             self._translation_cache.clear()
 
+    def clear_language_cache(self):
+        """Clear the memoized language detection results."""
+        self._detect_language_cached.cache_clear()
+
+    def clear_normalize_cache(self):
+        """Clear the memoized normalization results."""
+        self._normalize_cached.cache_clear()
+
+    def clear_synonym_cache(self):
+        """Clear the memoized WordNet lemma lookups."""
+        self._wordnet_lemmas_cached.cache_clear()
+
     def get_translation_cache_size(self) -> int:
         """Get the number of cached translations."""
         return len(self._translation_cache) if self._translation_cache is not None else 0
@@ -826,7 +928,7 @@ def main():
     import sys
     import io
 
-    if sys.platform == 'win32':
+    if sys.platform == 'win32' and (sys.stdout.encoding or '').lower() not in ('utf-8', 'utf8'):
         sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8', errors='replace')
 
     processor = QueryProcessor(remove_stopwords=False)
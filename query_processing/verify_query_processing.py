@@ -9,7 +9,7 @@ import io
 import time
 
 # Handle Unicode output on Windows
-if sys.platform == 'win32':
+if sys.platform == 'win32' and (sys.stdout.encoding or '').lower() not in ('utf-8', 'utf8'):
     sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8', errors='replace')
 
 from query_processor import QueryProcessor, ProcessedQuery
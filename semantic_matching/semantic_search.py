@@ -151,6 +151,19 @@ class SemanticSearch:
             qvec = qvec / norm
         return qvec
 
+    def encode_queries(self, queries: Sequence[str], batch_size: int = 32) -> np.ndarray:
+        """Encode several queries in one model call; rows match encode_query()."""
+        if any(not q or not q.strip() for q in queries):
+            raise ValueError("Query is empty")
+        if self._model is None:
+            self._load_model()
+        qvecs = np.array(self._model.encode(list(queries), batch_size=batch_size), dtype=np.float32)
+        if self.normalize_embeddings:
+            norms = np.linalg.norm(qvecs, axis=1, keepdims=True)
+            norms[norms == 0] = 1.0
+            qvecs = qvecs / norms
+        return qvecs
+
     def search(
         self,
         query: str,
@@ -170,21 +183,64 @@ class SemanticSearch:
             raise RuntimeError("Embeddings not loaded.")
 
         qvec = self.encode_query(query)
+        scores = self._cosine_scores(qvec[:, None])[:, 0]
+        return self._rank(scores, top_k, self._language_mask(languages), min_score)
+
+    def search_batch(
+        self,
+        queries: Sequence[str],
+        top_k: int = 10,
+        languages: Optional[Sequence[str]] = None,
+        min_score: Optional[float] = None,
+        batch_size: int = 32,
+    ) -> List[List[SemanticResult]]:
+        """Semantic search for several queries at once.
+
+        Queries are encoded in batches and scored against the corpus with a
+        single matrix product, which is much cheaper than calling search()
+        per query. Arguments are as in search().
 
-        # Compute cosine similarity (dot product if normalized)
-        scores = self._embeddings @ qvec
+        Returns:
+            One result list per query, in order.
+        """
+        if self._embeddings is None:
+            raise RuntimeError("Embeddings not loaded.")
+        if not queries:
+            return []
+
+        qvecs = self.encode_queries(queries, batch_size=batch_size)
+        scores = self._cosine_scores(qvecs.T)
+        mask = self._language_mask(languages)
+        return [self._rank(scores[:, i], top_k, mask, min_score) for i in range(len(queries))]
+
+    def _cosine_scores(self, qvecs: np.ndarray) -> np.ndarray:
+        """Cosine similarity of every document (rows) to query columns."""
+        # Dot product if normalized
+        scores = self._embeddings @ qvecs
         if not self.normalize_embeddings:
-            qnorm = np.linalg.norm(qvec)
-            if qnorm == 0:
-                qnorm = 1.0
-            denom = self._embedding_norms * qnorm
+            qnorms = np.linalg.norm(qvecs, axis=0)
+            qnorms[qnorms == 0] = 1.0
+            denom = self._embedding_norms[:, None] * qnorms
             denom[denom == 0] = 1.0
             scores = scores / denom
+        return scores
+
+    def _language_mask(self, languages: Optional[Sequence[str]]) -> Optional[np.ndarray]:
+        """Boolean mask of documents in the allowed languages (None for no filter)."""
+        if not languages:
+            return None
+        allowed = set(languages)
+        return np.array([a["language"] in allowed for a in self._articles], dtype=bool)
 
-        mask = None
-        if languages:
-            allowed = set(languages)
-            mask = np.array([a["language"] in allowed for a in self._articles], dtype=bool)
+    def _rank(
+        self,
+        scores: np.ndarray,
+        top_k: int,
+        mask: Optional[np.ndarray],
+        min_score: Optional[float],
+    ) -> List[SemanticResult]:
+        """Turn one query's document scores into ranked results."""
+        if mask is not None:
             scores = np.where(mask, scores, -np.inf)
 
         # Get top-k indices
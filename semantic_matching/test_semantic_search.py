@@ -9,7 +9,7 @@ import sys
 import io
 from pathlib import Path
 
-if sys.platform == "win32":
+if sys.platform == "win32" and (sys.stdout.encoding or "").lower() not in ("utf-8", "utf8"):
     sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding="utf-8", errors="replace")
 
 from semantic_search import SemanticSearch  # noqa: E402